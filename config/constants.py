@@ -4,6 +4,7 @@ Defines test-related constants and enumerations.
 """
 
 from enum import Enum, IntEnum
+from functools import lru_cache
 
 
 # Python 3.10 호환성을 위한 StrEnum 대체
@@ -196,35 +197,42 @@ class ProcessState(IntEnum):
         """
         if not text:
             return cls.UNKNOWN
+        # 정규화 후 캐시 조회 ('IDLE'/'idle'/' Idle '이 같은 캐시 항목을 공유)
+        return _classify_process_state(text.strip().lower())
 
-        # 정확한 매칭 먼저 시도 (Button6 스타일)
-        state_map = {
-            "Idle": cls.IDLE,
-            "Pass": cls.PASS,
-            "Stop": cls.STOP,
-            "Fail": cls.FAIL,
-            "Test": cls.TEST,
-        }
-        if text in state_map:
-            return state_map[text]
 
-        # 대소문자 무시 매칭 시도
-        text_lower = text.lower().strip()
-        for key, value in state_map.items():
-            if key.lower() == text_lower:
-                return value
+# from_text 조회 테이블 (소문자 상태 텍스트 → ProcessState)
+_PROCESS_STATE_BY_TEXT: dict[str, ProcessState] = {
+    "idle": ProcessState.IDLE,
+    "pass": ProcessState.PASS,
+    "stop": ProcessState.STOP,
+    "fail": ProcessState.FAIL,
+    "test": ProcessState.TEST,
+}
+
+
+@lru_cache(maxsize=512)
+def _classify_process_state(text: str) -> ProcessState:
+    """Classify normalized (stripped, lowercase) state text.
+
+    Args:
+        text: Normalized state text.
+
+    Returns:
+        ProcessState enum value.
+    """
+    # 단순 텍스트 (Button6 스타일: 'Idle', 'Pass')
+    state = _PROCESS_STATE_BY_TEXT.get(text)
+    if state is not None:
+        return state
 
-        # 복합 텍스트에서 상태 추출 (예: '10/10 IDLE' → 'IDLE')
-        # Static 컨트롤이 '숫자/숫자 상태' 형식으로 표시되는 경우
-        parts = text.split()
-        if len(parts) >= 2:
-            # 마지막 부분이 상태일 가능성
-            last_part = parts[-1]
-            for key, value in state_map.items():
-                if key.lower() == last_part.lower():
-                    return value
+    # 복합 텍스트에서 상태 추출 (예: '10/10 idle' → 'idle')
+    # Static 컨트롤이 '숫자/숫자 상태' 형식으로 표시되는 경우 마지막 토큰이 상태
+    parts = text.split()
+    if len(parts) >= 2:
+        return _PROCESS_STATE_BY_TEXT.get(parts[-1], ProcessState.UNKNOWN)
 
-        return cls.UNKNOWN
+    return ProcessState.UNKNOWN
 
 
 class TestPhase(IntEnum):
@@ -258,35 +266,62 @@ class TestPhase(IntEnum):
         """
         if not text:
             return cls.UNKNOWN
+        # 루프/파일 카운터 숫자를 제거해 진행 중에도 같은 캐시 항목을 재사용
+        return _classify_test_phase(text.translate(_STRIP_DIGITS))
 
-        # Extract alphabets only for mapping
-        cleaned = "".join(c for c in text if c.isalpha())
 
-        phase_map = {
-            "ContactTest": cls.CONTACT,
-            "FileCopy": cls.COPY,
-            "TestStop": cls.STOP,
-            "FileCompare": cls.COMPARE,
-            "FileDel": cls.DELETE,
-            "IDLE": cls.IDLE,
-        }
+# from_text 조회 테이블 (순서가 부분 매칭 우선순위)
+_TEST_PHASE_BY_TEXT: dict[str, TestPhase] = {
+    "ContactTest": TestPhase.CONTACT,
+    "FileCopy": TestPhase.COPY,
+    "TestStop": TestPhase.STOP,
+    "FileCompare": TestPhase.COMPARE,
+    "FileDel": TestPhase.DELETE,
+    "IDLE": TestPhase.IDLE,
+}
+_TEST_PHASE_BY_LOWER: tuple[tuple[str, TestPhase], ...] = tuple(
+    (key.lower(), value) for key, value in _TEST_PHASE_BY_TEXT.items()
+)
+
+# TestPhase 캐시 키 정규화 테이블 (숫자 제거 - 단계 이름에는 숫자가 없음)
+_STRIP_DIGITS = str.maketrans("", "", "0123456789")
 
-        # 직접 매핑 시도
-        if cleaned in phase_map:
-            return phase_map[cleaned]
 
-        # 부분 문자열 매칭 (예: 'FileCopy' in 'FileCompare35/88' 형태)
-        for key, value in phase_map.items():
-            if key in cleaned:
-                return value
+@lru_cache(maxsize=512)
+def _classify_test_phase(text: str) -> TestPhase:
+    """Classify test phase text with digits removed.
 
-        # 공백 제거 후 부분 매칭 (예: 'File Copy' -> 'FileCopy')
-        text_no_space = text.replace(" ", "")
-        for key, value in phase_map.items():
-            if key.lower() in text_no_space.lower():
-                return value
+    Progress text such as '4/10  File Copy 35/88' carries counters that
+    change throughout a run, so callers strip digits before the lookup.
+    Case is kept: the case-sensitive substring pass takes priority over
+    the case-insensitive one, so case cannot be folded first.
 
-        return cls.UNKNOWN
+    Args:
+        text: Test phase text read from UI, without digits.
+
+    Returns:
+        TestPhase enum value.
+    """
+    # Extract alphabets only for mapping
+    cleaned = "".join(filter(str.isalpha, text))
+
+    # 직접 매핑 시도
+    phase = _TEST_PHASE_BY_TEXT.get(cleaned)
+    if phase is not None:
+        return phase
+
+    # 부분 문자열 매칭 (예: 'FileCopy' in 'FileCompare35/88' 형태)
+    for key, value in _TEST_PHASE_BY_TEXT.items():
+        if key in cleaned:
+            return value
+
+    # 공백 제거 후 대소문자 무시 부분 매칭 (예: 'file copy' -> 'filecopy')
+    text_no_space = text.replace(" ", "").lower()
+    for key, value in _TEST_PHASE_BY_LOWER:
+        if key in text_no_space:
+            return value
+
+    return TestPhase.UNKNOWN
 
 
 class ErrorCode(IntEnum):
@@ -10,6 +10,7 @@ from .state_machine import (
     SlotStateMachineManager,
     InvalidTransitionError,
 )
+from .status import determine_status
 
 __all__ = [
     "TestConfig",
@@ -25,4 +26,6 @@ __all__ = [
     "SlotStateMachine",
     "SlotStateMachineManager",
     "InvalidTransitionError",
+    # Status
+    "determine_status",
 ]
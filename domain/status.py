@@ -0,0 +1,83 @@
+"""Frontend Status Determination.
+
+Maps MFC UI state (ProcessState, loop progress, TestPhase) to the status
+string reported to the Frontend.
+"""
+
+from domain.enums import ProcessState, TestPhase
+
+
+def _status_rule(process_state: ProcessState, loop_complete: bool, phase_idle: bool) -> str:
+    """Frontend status decision rule (순서 중요!).
+
+    Args:
+        process_state: USB Test process state.
+        loop_complete: Whether all loops are done (total > 0 and current == total).
+        phase_idle: Whether the test phase is IDLE.
+
+    Returns:
+        Frontend status string.
+    """
+    # 1. Fail은 항상 failed (최우선)
+    if process_state == ProcessState.FAIL:
+        return "failed"
+
+    # 2. Stop은 항상 stopping
+    if process_state == ProcessState.STOP:
+        return "stopping"
+
+    # 3. 루프 완료 조건 (Pass 상태에서도 루프가 끝나고 Phase가 IDLE이면 완료)
+    if loop_complete and phase_idle:
+        return "completed"
+
+    # 4. Pass 또는 Test는 running (테스트 진행 중)
+    if process_state in (ProcessState.PASS, ProcessState.TEST):
+        return "running"
+
+    # 5. Idle 상태 (테스트 시작 전 대기)
+    if process_state == ProcessState.IDLE:
+        return "idle"
+
+    # Unknown 또는 기타
+    return "error"
+
+
+# (ProcessState, 루프 완료 여부, Phase == IDLE) → Frontend 상태 (import 시 1회 계산)
+_STATUS_TABLE: dict[tuple[ProcessState, bool, bool], str] = {
+    (process_state, loop_complete, phase_idle): _status_rule(
+        process_state, loop_complete, phase_idle
+    )
+    for process_state in ProcessState
+    for loop_complete in (False, True)
+    for phase_idle in (False, True)
+}
+
+
+def determine_status(
+    process_state: ProcessState,
+    current_loop: int,
+    total_loop: int,
+    test_phase: TestPhase,
+) -> str:
+    """Determine Frontend status from MFC UI state values.
+
+    Status determination logic:
+    1. Fail: 테스트 실패 -> "failed" (최우선)
+    2. Stop: 중지됨 -> "stopping"
+    3. 완료 조건 (루프 완료): current_loop == total_loop and Phase == IDLE -> "completed"
+       - Pass 상태라도 루프가 모두 완료되고 Phase가 IDLE이면 completed
+    4. Pass/Test: 테스트 진행 중 -> "running"
+    5. Idle: 대기 상태 -> "idle"
+
+    Args:
+        process_state: USB Test process state.
+        current_loop: Current loop number.
+        total_loop: Total loop count.
+        test_phase: Current test phase.
+
+    Returns:
+        Frontend status string ("error" for unknown states).
+    """
+    loop_complete = total_loop > 0 and current_loop == total_loop
+    key = (process_state, loop_complete, test_phase == TestPhase.IDLE)
+    return _STATUS_TABLE.get(key, "error")
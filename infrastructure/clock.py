@@ -73,6 +73,10 @@ class FakeClock(IClock):
         self._monotonic = initial_monotonic
         self._sleep_calls: list[float] = []
 
+        # reset() 시 복원할 초기값
+        self._initial_time = self._current_time
+        self._initial_monotonic = initial_monotonic
+
     def now(self) -> datetime:
         """Return current (fake) time."""
         return self._current_time
@@ -80,8 +84,9 @@ class FakeClock(IClock):
     async def sleep(self, seconds: float) -> None:
         """Fake sleep (returns immediately).
 
-        Does not actually wait, only records the call.
-        Yields control to the event loop to prevent busy loops in tests.
+        Does not actually wait or advance time (use ``advance()``), only
+        records the call. Yields control to the event loop once so that
+        polling loops built on ``clock.sleep`` do not starve other tasks.
 
         Args:
             seconds: Sleep duration in seconds.
@@ -121,3 +126,9 @@ class FakeClock(IClock):
     def clear_sleep_calls(self) -> None:
         """Clear sleep call history."""
         self._sleep_calls.clear()
+
+    def reset(self) -> None:
+        """Restore initial time/monotonic values and clear sleep history."""
+        self._current_time = self._initial_time
+        self._monotonic = self._initial_monotonic
+        self._sleep_calls.clear()
@@ -156,6 +156,20 @@ class FakeStateStore(IStateStore):
         self._set_calls.append((slot_idx, state.copy()))
         self._states[slot_idx] = state
 
+    def patch_slot_state(self, slot_idx: int, **fields: Any) -> None:
+        """Update individual fields of a slot state in place.
+
+        The resulting state is recorded in ``set_calls`` like a
+        ``set_slot_state`` write.
+
+        Args:
+            slot_idx: Slot index.
+            **fields: Fields to update.
+        """
+        state = self._states.setdefault(slot_idx, {})
+        state.update(fields)
+        self._set_calls.append((slot_idx, state.copy()))
+
     def get_all_states(self) -> dict[int, dict[str, Any]]:
         """Get all states."""
         return self._states.copy()
@@ -167,10 +181,15 @@ class FakeStateStore(IStateStore):
 
     @property
     def set_calls(self) -> list[tuple[int, dict[str, Any]]]:
-        """set_slot_state call history."""
+        """set_slot_state/patch_slot_state write history."""
         return self._set_calls
 
     def clear_calls(self) -> None:
         """Clear call history."""
         self._get_calls.clear()
         self._set_calls.clear()
+
+    def clear(self) -> None:
+        """Clear all stored states and call history."""
+        self._states.clear()
+        self.clear_calls()
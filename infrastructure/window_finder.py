@@ -486,6 +486,15 @@ class FakeWindowFinder(IWindowFinder):
         """start_process call history."""
         return self._start_process_calls
 
+    def reset(self) -> None:
+        """Remove registered windows/processes and clear call history."""
+        self._windows.clear()
+        self._processes.clear()
+        self._find_window_calls.clear()
+        self._find_process_calls.clear()
+        self._start_process_calls.clear()
+        self._auto_create_window_on_start = True
+
 
 class FakeWindowHandle(IWindowHandle):
     """Fake window handle for testing."""
@@ -5,6 +5,7 @@ All dependencies are injected via DI Container.
 """
 
 import asyncio
+import contextlib
 import signal
 from typing import TYPE_CHECKING, Awaitable, Callable
 
@@ -41,6 +42,7 @@ from domain import (
     SlotEvent,
     SlotState,
     SlotStateMachineManager,
+    determine_status,
 )
 
 # Infrastructure - 실제 구현체
@@ -581,13 +583,7 @@ class Agent:
     def _determine_status(self, state: MFCUIState) -> str:
         """Determine Frontend status from MFC UI state.
 
-        Status determination logic (순서 중요!):
-        1. Fail: 테스트 실패 -> "failed" (최우선)
-        2. Stop: 중지됨 -> "stopping"
-        3. 완료 조건 (루프 완료): current_loop == total_loop and Phase == IDLE -> "completed"
-           - Pass 상태라도 루프가 모두 완료되고 Phase가 IDLE이면 completed
-        4. Pass/Test: 테스트 진행 중 -> "running"
-        5. Idle: 대기 상태 -> "idle"
+        See ``domain.determine_status`` for the decision rules.
 
         Args:
             state: Current MFC UI state.
@@ -595,37 +591,12 @@ class Agent:
         Returns:
             Frontend status string.
         """
-        from config.constants import TestPhase
-
-        process_state = state.process_state
-
-        # 1. Fail은 항상 failed (최우선)
-        if process_state == ProcessState.FAIL:
-            return "failed"
-
-        # 2. Stop은 항상 stopping
-        if process_state == ProcessState.STOP:
-            return "stopping"
-
-        # 3. 루프 완료 조건 (Pass/Idle 상태이면서 완료)
-        # Pass 상태에서도 루프가 끝나면 완료로 처리해야 함
-        if (
-            state.total_loop > 0
-            and state.current_loop == state.total_loop
-            and state.test_phase == TestPhase.IDLE
-        ):
-            return "completed"
-
-        # 4. Pass 또는 Test는 running (테스트 진행 중)
-        if process_state in (ProcessState.PASS, ProcessState.TEST):
-            return "running"
-
-        # 5. Idle 상태 (테스트 시작 전 대기)
-        if process_state == ProcessState.IDLE:
-            return "idle"
-
-        # Unknown 또는 기타
-        return "error"
+        return determine_status(
+            state.process_state,
+            state.current_loop,
+            state.total_loop,
+            state.test_phase,
+        )
 
     async def _on_mfc_ui_polled(self, state: MFCUIState) -> None:
         """Callback on every MFC UI poll.
@@ -1472,7 +1443,12 @@ class Agent:
                     break
 
                 # TODO: 추가적인 상태 모니터링 로직
-                await asyncio.sleep(1)
+                # stop()이 shutdown 이벤트를 설정하면 1초를 기다리지 않고 즉시 깨어난다
+                if self._shutdown_event is None:
+                    await asyncio.sleep(1)
+                    continue
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._shutdown_event.wait(), timeout=1)
 
         except Exception as e:
             logger.error("Error in main loop", error=str(e))
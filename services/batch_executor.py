@@ -9,6 +9,7 @@ Inspired by workflow engines like Celery, Prefect, and asyncio patterns.
 from __future__ import annotations
 
 import asyncio
+import logging
 import math
 from dataclasses import dataclass
 from datetime import datetime
@@ -403,12 +404,14 @@ class BatchExecutor:
             # 직접 MFC UI에서 현재 상태 읽기
             process_state = await self._read_process_state_from_ui(slot_idx)
 
-            logger.debug(
-                "Polling MFC state",
-                slot_idx=slot_idx,
-                process_state=process_state.name if process_state else "None",
-                test_started=test_started,
-            )
+            # 폴링마다 호출되므로 DEBUG 비활성 시 kwargs 구성 자체를 생략
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Polling MFC state",
+                    slot_idx=slot_idx,
+                    process_state=process_state.name if process_state else "None",
+                    test_started=test_started,
+                )
 
             if process_state is None:
                 await asyncio.sleep(self._poll_interval)
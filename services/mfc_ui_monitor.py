@@ -5,6 +5,7 @@ Periodically polls the UI to detect state changes made by user or test progress.
 """
 
 import asyncio
+import re
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from datetime import datetime
@@ -19,6 +20,9 @@ from config.constants import (
 from controller.window_manager import SlotWindowManager, WindowManager
 from core.protocols import IClock, ILogger
 
+# 진행 텍스트 앞부분의 '현재루프/총루프' 패턴 (예: '4/10')
+_PROGRESS_RE = re.compile(r"(\d+)/(\d+)")
+
 
 @dataclass
 class MFCUIState:
@@ -439,10 +443,7 @@ class MFCUIMonitor:
         if not state.progress_text:
             return
 
-        import re
-
-        # 패턴: '숫자/숫자' (예: '4/10')
-        match = re.match(r"(\d+)/(\d+)", state.progress_text.strip())
+        match = _PROGRESS_RE.match(state.progress_text.strip())
         if match:
             try:
                 state.current_loop = int(match.group(1))
@@ -6,6 +6,7 @@ and notifies the system.
 """
 
 import asyncio
+import sys
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from datetime import datetime
@@ -16,6 +17,38 @@ import psutil
 from config.constants import SlotConfig
 from core.protocols import IClock, ILogger
 
+# procfs 사용 가능 여부 (import 시 1회 판단 - 운영 대상인 Windows에는 없음)
+_HAS_PROCFS = sys.platform.startswith("linux")
+
+# /proc/<pid>/stat 상태 코드 중 종료(또는 종료 직전)를 의미하는 값
+_PROC_DEAD_STATES = frozenset({"Z", "X", "x"})
+
+
+def _read_proc_state(pid: int) -> str | None:
+    """Read the kernel state code of a process from procfs.
+
+    Cheap alternative to constructing a ``psutil.Process`` just to read its
+    status. Only meaningful on Linux; callers check ``_HAS_PROCFS`` first.
+
+    Args:
+        pid: Process ID.
+
+    Returns:
+        Single-character state code (e.g. "R", "S", "Z"), or None if procfs
+        is unavailable or the entry could not be read.
+    """
+    try:
+        with open(f"/proc/{pid}/stat", "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+
+    # 형식: "pid (comm) S ..." - comm에 공백/괄호가 올 수 있어 마지막 ')' 기준으로 파싱
+    end = data.rfind(b")")
+    if end < 0 or end + 2 >= len(data):
+        return None
+    return chr(data[end + 2])
+
 
 class ProcessTerminationReason(str, Enum):
     """Reason for process termination."""
@@ -150,6 +183,15 @@ class ProcessMonitor:
         """
         self._slot_running[slot_idx] = is_running
 
+    def reset(self) -> None:
+        """Clear all watched slots and the termination callback.
+
+        Does not stop a running monitor loop; call ``stop()`` first if needed.
+        """
+        self._watched_pids.clear()
+        self._slot_running.clear()
+        self._on_termination = None
+
     @property
     def is_running(self) -> bool:
         """Monitoring running status."""
@@ -211,6 +253,12 @@ class ProcessMonitor:
                     continue
 
                 # 프로세스가 존재하는 경우, 상태 확인
+                # procfs에서 정상 상태가 확인되면 psutil.Process 생성 생략
+                if _HAS_PROCFS:
+                    proc_state = _read_proc_state(pid)
+                    if proc_state is not None and proc_state not in _PROC_DEAD_STATES:
+                        continue
+
                 try:
                     proc = psutil.Process(pid)
                     status = proc.status()
@@ -15,8 +15,28 @@ from core.protocols import (
     ILogger,
 )
 
+# 변경 감지 대상 필드 (순서 고정 - 튜플 비교에 사용)
+_WATCH_KEYS = ("status", "progress", "current_phase", "error_message")
+_PROGRESS_IDX = _WATCH_KEYS.index("progress")
+_EMPTY_FIELDS: tuple[Any, ...] = (None,) * len(_WATCH_KEYS)
 
-@dataclass
+# Hang 감지 기본 임계값 (초)
+_DEFAULT_HANG_THRESHOLD_SECONDS = 300.0
+
+
+def _watched_fields(state: dict[str, Any]) -> tuple[Any, ...]:
+    """Extract watched fields as a tuple for single-compare change detection.
+
+    Args:
+        state: Slot state dictionary.
+
+    Returns:
+        Tuple of watched field values (missing keys become None).
+    """
+    return tuple(map(state.get, _WATCH_KEYS))
+
+
+@dataclass(slots=True, frozen=True)
 class SlotSnapshot:
     """Slot state snapshot.
 
@@ -83,7 +103,8 @@ class StateMonitor:
         # 상태
         self._is_running = False
         self._monitor_task: Optional[asyncio.Task] = None
-        self._previous_states: dict[int, dict[str, Any]] = {}
+        # 슬롯별 이전 감시 필드 (_WATCH_KEYS 순서의 튜플)
+        self._previous_fields: dict[int, tuple[Any, ...]] = {}
 
         # 콜백
         self._on_change: Optional[Callable[[SlotSnapshot], Awaitable[None]]] = None
@@ -91,7 +112,7 @@ class StateMonitor:
 
         # Hang 감지
         self._last_progress_change: dict[int, float] = {}
-        self._hang_threshold_seconds = 300.0
+        self._hang_threshold_seconds = _DEFAULT_HANG_THRESHOLD_SECONDS
 
     def set_change_callback(
         self,
@@ -107,7 +128,7 @@ class StateMonitor:
     def set_hang_callback(
         self,
         callback: Callable[[int, float], Awaitable[None]],
-        threshold_seconds: float = 300.0,
+        threshold_seconds: float = _DEFAULT_HANG_THRESHOLD_SECONDS,
     ) -> None:
         """Set hang detection callback.
 
@@ -118,6 +139,17 @@ class StateMonitor:
         self._on_hang_detected = callback
         self._hang_threshold_seconds = threshold_seconds
 
+    def reset(self) -> None:
+        """Clear cached slot states, hang timers and callbacks.
+
+        Does not stop a running monitor loop; call ``stop()`` first if needed.
+        """
+        self._previous_fields.clear()
+        self._last_progress_change.clear()
+        self._on_change = None
+        self._on_hang_detected = None
+        self._hang_threshold_seconds = _DEFAULT_HANG_THRESHOLD_SECONDS
+
     @property
     def is_running(self) -> bool:
         """Monitoring running status."""
@@ -190,10 +222,11 @@ class StateMonitor:
         if not current_state:
             return
 
-        previous_state = self._previous_states.get(slot_idx, {})
+        current_fields = _watched_fields(current_state)
+        previous_fields = self._previous_fields.get(slot_idx, _EMPTY_FIELDS)
 
         # 변경 감지
-        is_changed = self._detect_change(current_state, previous_state)
+        is_changed = self._detect_change(current_fields, previous_fields)
 
         if is_changed:
             snapshot = SlotSnapshot(
@@ -208,36 +241,30 @@ class StateMonitor:
                 await self._on_change(snapshot)
 
             # 진행률 변경 시간 업데이트
-            if current_state.get("progress") != previous_state.get("progress"):
+            if current_fields[_PROGRESS_IDX] != previous_fields[_PROGRESS_IDX]:
                 self._last_progress_change[slot_idx] = current_time
 
         # Hang 감지
         await self._check_hang(slot_idx, current_state, current_time)
 
-        # 이전 상태 저장
-        self._previous_states[slot_idx] = current_state.copy()
+        # 이전 상태 저장 (감시 필드 튜플만 보관 - 상태 dict 복사 불필요)
+        self._previous_fields[slot_idx] = current_fields
 
     def _detect_change(
         self,
-        current: dict[str, Any],
-        previous: dict[str, Any],
+        current: tuple[Any, ...],
+        previous: tuple[Any, ...],
     ) -> bool:
         """Detect state change.
 
         Args:
-            current: Current state.
-            previous: Previous state.
+            current: Current watched fields.
+            previous: Previous watched fields.
 
         Returns:
             Whether changed.
         """
-        watch_keys = ["status", "progress", "current_phase", "error_message"]
-
-        for key in watch_keys:
-            if current.get(key) != previous.get(key):
-                return True
-
-        return False
+        return current != previous
 
     async def _check_hang(
         self,
@@ -312,3 +339,16 @@ class StateMonitor:
             if snapshot:
                 snapshots.append(snapshot)
         return snapshots
+
+    def get_snapshots_by_slot(self) -> dict[int, SlotSnapshot]:
+        """Get all slot snapshots keyed by slot index.
+
+        Returns:
+            Dictionary of snapshots by slot (slots without state are omitted).
+        """
+        snapshots: dict[int, SlotSnapshot] = {}
+        for slot_idx in range(self._max_slots):
+            snapshot = self.get_snapshot(slot_idx)
+            if snapshot:
+                snapshots[slot_idx] = snapshot
+        return snapshots
@@ -44,6 +44,16 @@ class SlotTask(WorkerItem):
     slot_idx: int = field(compare=False, default=0)
 
 
+def _discard_pending(queue: asyncio.Queue) -> None:
+    """큐에 남은 작업을 실행 없이 꺼내고 완료 처리(join 대기 해제)."""
+    while True:
+        try:
+            queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return
+        queue.task_done()
+
+
 class _QueueWorker:
     """우선순위 큐 기반 워커."""
 
@@ -81,6 +91,14 @@ class _QueueWorker:
         self._task = None
         self._logger.info("Worker stopped", worker=self._name)
 
+    async def join(self) -> None:
+        """큐가 비고 실행 중인 작업이 모두 끝날 때까지 대기."""
+        await self._queue.join()
+
+    def clear(self) -> None:
+        """대기 중인 작업을 실행하지 않고 제거."""
+        _discard_pending(self._queue)
+
     async def enqueue(
         self,
         item: WorkerItem,
@@ -184,6 +202,29 @@ class WorkerPool:
             await worker.stop()
         logger.info("Worker pool stopped")
 
+    async def join(self) -> None:
+        """적재된 모든 작업이 처리될 때까지 대기.
+
+        Scheduler가 슬롯 워커로 전달을 마친 뒤 슬롯 워커와 Top 워커의 큐가
+        모두 비고 실행 중인 작업이 끝나면 반환한다. 풀이 시작되지 않은
+        상태에서 작업이 남아 있으면 반환되지 않으므로 start() 이후 호출한다.
+        """
+        await self._scheduler_queue.join()
+        for worker in self._slot_workers.values():
+            await worker.join()
+        await self._top_worker.join()
+
+    def clear(self) -> None:
+        """대기 중인 작업을 실행하지 않고 모두 제거.
+
+        실행 중인 작업은 취소하지 않으며 워커 루프도 유지된다. 시작된 풀을
+        재사용하기 전에 큐를 비울 때 사용한다.
+        """
+        _discard_pending(self._scheduler_queue)
+        for worker in self._slot_workers.values():
+            worker.clear()
+        self._top_worker.clear()
+
     async def enqueue_top(
         self,
         name: str,
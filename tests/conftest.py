@@ -4,10 +4,14 @@ Defines common fixtures used in pytest.
 Provides mock objects, test containers, etc.
 """
 
+import asyncio
+from collections import defaultdict
 from datetime import datetime
-from typing import Generator, Any
+from typing import AsyncGenerator, Generator, Any
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+import pytest_asyncio
 
 # Config
 from config.settings import AgentSettings
@@ -56,26 +60,40 @@ class FakeLogger(ILogger):
 
     def __init__(self) -> None:
         self.logs: list[dict[str, Any]] = []
+        self._by_level: defaultdict[str, list[dict[str, Any]]] = defaultdict(list)
+
+    def _log(self, level: str, message: str, **kwargs: Any) -> None:
+        entry = {"level": level, "message": message, **kwargs}
+        self.logs.append(entry)
+        self._by_level[level].append(entry)
 
     def debug(self, message: str, **kwargs: Any) -> None:
-        self.logs.append({"level": "debug", "message": message, **kwargs})
+        self._log("debug", message, **kwargs)
 
     def info(self, message: str, **kwargs: Any) -> None:
-        self.logs.append({"level": "info", "message": message, **kwargs})
+        self._log("info", message, **kwargs)
 
     def warning(self, message: str, **kwargs: Any) -> None:
-        self.logs.append({"level": "warning", "message": message, **kwargs})
+        self._log("warning", message, **kwargs)
 
     def error(self, message: str, **kwargs: Any) -> None:
-        self.logs.append({"level": "error", "message": message, **kwargs})
+        self._log("error", message, **kwargs)
 
     def clear(self) -> None:
         self.logs.clear()
+        self._by_level.clear()
 
     def get_logs(self, level: str | None = None) -> list[dict[str, Any]]:
         if level is None:
             return self.logs
-        return [log for log in self.logs if log["level"] == level]
+        # 내부 인덱스를 노출하지 않도록 복사본을 반환 (없는 레벨은 키를 만들지 않음)
+        return list(self._by_level.get(level, ()))
+
+    def has_message(self, level: str, substring: str) -> bool:
+        """Return True if any ``level`` log message contains ``substring``."""
+        return any(
+            substring in log["message"] for log in self._by_level.get(level, ())
+        )
 
 
 # ============================================================
@@ -128,13 +146,72 @@ def sample_test_state() -> TestState:
     )
 
 
+# ============================================================
+# Event Loop Hygiene
+# ============================================================
+
+
+# 모든 비동기 테스트는 세션 이벤트 루프 하나를 공유하므로(pyproject.toml의
+# asyncio_default_*_loop_scope), 테스트가 남긴 태스크가 다음 테스트로
+# 새어 나가지 않도록 테스트 종료 시 새로 생긴 미완료 태스크를 취소한다.
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def _cancel_leaked_tasks() -> AsyncGenerator[None, None]:
+    """Cancel tasks a test left running on the shared event loop."""
+    before = asyncio.all_tasks()
+
+    yield
+
+    current = asyncio.current_task()
+    leaked = [
+        task for task in asyncio.all_tasks()
+        if task is not current and task not in before and not task.done()
+    ]
+    for task in leaked:
+        task.cancel()
+    if leaked:
+        await asyncio.gather(*leaked, return_exceptions=True)
+
+
 # ============================================================
 # Core Fixtures (새 아키텍처)
 # ============================================================
 
 
+# Fake 인프라는 세션당 한 번만 생성하고, 함수 스코프 fixture에서
+# 매 테스트 시작 시 reset/clear로 초기 상태를 복원해 재사용한다.
+
+
+@pytest.fixture(scope="session")
+def _session_fake_clock() -> FakeClock:
+    """Session-wide FakeClock instance (use ``fake_clock``)."""
+    return FakeClock(
+        initial_time=datetime(2025, 1, 1, 12, 0, 0),
+        initial_monotonic=0.0,
+    )
+
+
+@pytest.fixture(scope="session")
+def _session_fake_logger() -> FakeLogger:
+    """Session-wide FakeLogger instance (use ``fake_logger``)."""
+    return FakeLogger()
+
+
+@pytest.fixture(scope="session")
+def _session_fake_state_store() -> FakeStateStore:
+    """Session-wide FakeStateStore instance (use ``fake_state_store``)."""
+    return FakeStateStore()
+
+
+@pytest.fixture(scope="session")
+def _session_fake_window_finder() -> FakeWindowFinder:
+    """Session-wide FakeWindowFinder instance (use ``fake_window_finder``)."""
+    return FakeWindowFinder()
+
+
 @pytest.fixture
-def fake_clock() -> FakeClock:
+def fake_clock(_session_fake_clock: FakeClock) -> FakeClock:
     """Fake clock fixture.
 
     Allows time control in tests.
@@ -146,31 +223,34 @@ def fake_clock() -> FakeClock:
                 assert fake_clock.monotonic() == 60
             ```
     """
-    return FakeClock(
-        initial_time=datetime(2025, 1, 1, 12, 0, 0),
-        initial_monotonic=0.0,
-    )
+    _session_fake_clock.reset()
+    return _session_fake_clock
 
 
 @pytest.fixture
-def fake_logger() -> FakeLogger:
+def fake_logger(_session_fake_logger: FakeLogger) -> FakeLogger:
     """Fake logger fixture.
 
     Allows verification of log messages.
     """
-    return FakeLogger()
+    _session_fake_logger.clear()
+    return _session_fake_logger
 
 
 @pytest.fixture
-def fake_state_store() -> FakeStateStore:
+def fake_state_store(_session_fake_state_store: FakeStateStore) -> FakeStateStore:
     """Fake state store fixture."""
-    return FakeStateStore()
+    _session_fake_state_store.clear()
+    return _session_fake_state_store
 
 
 @pytest.fixture
-def fake_window_finder() -> FakeWindowFinder:
+def fake_window_finder(
+    _session_fake_window_finder: FakeWindowFinder,
+) -> FakeWindowFinder:
     """Fake window finder fixture."""
-    return FakeWindowFinder()
+    _session_fake_window_finder.reset()
+    return _session_fake_window_finder
 
 
 @pytest.fixture
@@ -219,21 +299,59 @@ def test_executor(
     )
 
 
+@pytest.fixture(scope="session")
+def _session_state_monitor(
+    _session_fake_window_finder: FakeWindowFinder,
+    _session_fake_state_store: FakeStateStore,
+    _session_fake_clock: FakeClock,
+    _session_fake_logger: FakeLogger,
+) -> StateMonitor:
+    """Session-wide StateMonitor wired to the session fakes (use ``state_monitor``)."""
+    return StateMonitor(
+        window_finder=_session_fake_window_finder,
+        state_store=_session_fake_state_store,
+        clock=_session_fake_clock,
+        logger=_session_fake_logger,
+        max_slots=4,
+    )
+
+
 @pytest.fixture
 def state_monitor(
+    _session_state_monitor: StateMonitor,
+    _session_fake_window_finder: FakeWindowFinder,
+    _session_fake_state_store: FakeStateStore,
+    _session_fake_clock: FakeClock,
+    _session_fake_logger: FakeLogger,
     fake_window_finder: FakeWindowFinder,
     fake_state_store: FakeStateStore,
     fake_clock: FakeClock,
     fake_logger: FakeLogger,
 ) -> StateMonitor:
-    """StateMonitor fixture."""
-    return StateMonitor(
-        window_finder=fake_window_finder,
-        state_store=fake_state_store,
-        clock=fake_clock,
-        logger=fake_logger,
-        max_slots=4,
+    """StateMonitor fixture.
+
+    Reuses the session monitor, cleared with ``reset()`` before each test.
+    A test that overrides one of the fake fixtures gets a fresh monitor
+    wired to its own fakes instead.
+    """
+    session_fakes = (
+        _session_fake_window_finder,
+        _session_fake_state_store,
+        _session_fake_clock,
+        _session_fake_logger,
     )
+    test_fakes = (fake_window_finder, fake_state_store, fake_clock, fake_logger)
+    if any(a is not b for a, b in zip(session_fakes, test_fakes, strict=True)):
+        return StateMonitor(
+            window_finder=fake_window_finder,
+            state_store=fake_state_store,
+            clock=fake_clock,
+            logger=fake_logger,
+            max_slots=4,
+        )
+
+    _session_state_monitor.reset()
+    return _session_state_monitor
 
 
 # ============================================================
@@ -241,8 +359,15 @@ def state_monitor(
 # ============================================================
 
 
+@pytest.fixture(scope="session")
+def _session_test_container() -> Container:
+    """Session-wide container (use ``test_container``)."""
+    return Container()
+
+
 @pytest.fixture
 def test_container(
+    _session_test_container: Container,
     fake_window_finder: FakeWindowFinder,
     fake_state_store: FakeStateStore,
     fake_clock: FakeClock,
@@ -259,9 +384,10 @@ def test_container(
             Then: 단언문에 명시된 기대 결과가 충족된다.
 
         Notes:
-            None
+            세션 컨테이너를 비운 뒤 이번 테스트의 Fake fixture 값을 등록하므로
+            클래스/모듈 단위 fixture 오버라이드도 그대로 반영된다.
         """
-    container = Container()
+    container = _session_test_container.reset()
 
     container.register_instance(IWindowFinder, fake_window_finder)
     container.register_instance(IStateStore, fake_state_store)
@@ -275,6 +401,31 @@ def test_container(
     reset_container()
 
 
+# ============================================================
+# Mock Fixtures
+# ============================================================
+
+
+@pytest.fixture(scope="session")
+def _ws_client_template() -> MagicMock:
+    """Session-wide WebSocketClient mock (use ``ws_client_mock``)."""
+    mock = MagicMock()
+    mock.run = AsyncMock()
+    mock.disconnect = AsyncMock()
+    return mock
+
+
+@pytest.fixture
+def ws_client_mock(_ws_client_template: MagicMock) -> MagicMock:
+    """WebSocketClient mock with ``run``/``disconnect`` AsyncMocks.
+
+    Reuses one mock per session; call history, return values and side
+    effects are reset before each test.
+    """
+    _ws_client_template.reset_mock(return_value=True, side_effect=True)
+    return _ws_client_template
+
+
 # ============================================================
 # Test Data Fixtures
 # ============================================================
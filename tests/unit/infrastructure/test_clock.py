@@ -1,5 +1,6 @@
 """Infrastructure Clock Unit Tests."""
 
+import asyncio
 import pytest
 from datetime import datetime, timedelta
 
@@ -223,6 +224,41 @@ class TestFakeClock:
 
         assert 3600 in clock.sleep_calls
 
+    @pytest.mark.asyncio
+    async def test_sleep_yields_to_event_loop(self) -> None:
+        """[TC-CLOCK-013] 이벤트 루프 양보 - sleep 루프가 다른 태스크를 막지 않는다.
+
+        테스트 목적:
+            FakeClock.sleep이 시간은 진행시키지 않으면서 이벤트 루프에 제어를 넘겨,
+            clock.sleep으로 주기를 두는 폴링 루프가 busy loop가 되지 않는지 검증한다.
+
+        테스트 시나리오:
+            Given: clock.sleep(1.0)으로 반복하는 폴링 태스크를 실행하고
+            When: 테스트 코루틴에서 clock.sleep을 몇 번 호출한 뒤 중지 플래그를 설정하면
+            Then: 폴링 태스크가 종료되고 monotonic 값은 변하지 않는다
+
+        Notes:
+            시간 진행은 advance()로만 명시적으로 수행한다.
+        """
+        clock = FakeClock(initial_monotonic=0.0)
+        running = True
+        ticks = 0
+
+        async def poll_loop() -> None:
+            nonlocal ticks
+            while running:
+                ticks += 1
+                await clock.sleep(1.0)
+
+        task = asyncio.create_task(poll_loop())
+        for _ in range(3):
+            await clock.sleep(0)
+        running = False
+        await asyncio.wait_for(task, timeout=1.0)
+
+        assert ticks > 0
+        assert clock.monotonic() == 0.0
+
     def test_clear_sleep_calls(self) -> None:
         """[TC-CLOCK-011] sleep 기록 초기화 - 리스트를 비운다.
 
@@ -243,3 +279,29 @@ class TestFakeClock:
         clock.clear_sleep_calls()
 
         assert clock.sleep_calls == []
+
+    @pytest.mark.asyncio
+    async def test_reset_restores_initial_state(self) -> None:
+        """[TC-CLOCK-012] 초기화 - 시간과 sleep 기록을 생성 시점으로 되돌린다.
+
+        테스트 목적:
+            reset 호출 시 now/monotonic이 초기값으로 복원되고 sleep 기록이 비워지는지 검증한다.
+
+        테스트 시나리오:
+            Given: 초기 시각/monotonic을 지정한 FakeClock을 advance와 sleep으로 변경한 뒤
+            When: reset을 호출하면
+            Then: now와 monotonic이 초기값이 되고 sleep_calls가 빈 리스트가 된다
+
+        Notes:
+            None
+        """
+        initial = datetime(2025, 1, 1, 12, 0, 0)
+        clock = FakeClock(initial_time=initial, initial_monotonic=5.0)
+        clock.advance(seconds=60)
+        await clock.sleep(1.0)
+
+        clock.reset()
+
+        assert clock.now() == initial
+        assert clock.monotonic() == 5.0
+        assert clock.sleep_calls == []
@@ -328,3 +328,55 @@ class TestFakeStateStore:
         result = store.get_slot_state(99)
 
         assert result is None
+
+    def test_patch_slot_state_updates_fields(self) -> None:
+        """[TC-STATESTORE-014] 필드 단위 갱신 - 기존 상태를 제자리에서 갱신한다.
+
+        테스트 목적:
+            patch_slot_state가 지정 필드만 갱신하고 나머지 필드는 유지하는지 검증한다.
+
+        테스트 시나리오:
+            Given: 슬롯 0에 status/progress를 설정한 뒤
+            When: patch_slot_state(0, progress=80.0)을 호출하면
+            Then: progress만 갱신되고 status는 유지되며, 미설정 슬롯도 새로 생성되고
+                  각 갱신 결과가 set_calls에 기록된다
+
+        Notes:
+            None
+        """
+        store = FakeStateStore()
+        store.set_slot_state(0, {"status": "running", "progress": 10.0})
+
+        store.patch_slot_state(0, progress=80.0)
+        store.patch_slot_state(1, status="idle")
+
+        assert store.get_slot_state(0) == {"status": "running", "progress": 80.0}
+        assert store.get_slot_state(1) == {"status": "idle"}
+        assert store.set_calls[1:] == [
+            (0, {"status": "running", "progress": 80.0}),
+            (1, {"status": "idle"}),
+        ]
+
+    def test_clear_removes_states_and_calls(self) -> None:
+        """[TC-STATESTORE-015] 전체 초기화 - 저장된 상태와 호출 기록을 모두 비운다.
+
+        테스트 목적:
+            clear 호출 시 슬롯 상태와 get/set 호출 기록이 모두 삭제되는지 검증한다.
+
+        테스트 시나리오:
+            Given: 상태를 설정하고 조회해 기록을 남긴 뒤
+            When: clear를 호출하면
+            Then: 상태 조회 결과가 None이고 호출 기록이 비어 있다
+
+        Notes:
+            None
+        """
+        store = FakeStateStore()
+        store.set_slot_state(0, {"status": "running"})
+        store.get_slot_state(0)
+
+        store.clear()
+
+        assert store.get_all_states() == {}
+        assert store.get_calls == []
+        assert store.set_calls == []
@@ -0,0 +1,31 @@
+"""Service test fixtures."""
+
+from typing import AsyncGenerator
+
+import pytest_asyncio
+
+from services.worker_pool import WorkerPool
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def _session_worker_pool() -> AsyncGenerator[WorkerPool, None]:
+    """Session-wide started WorkerPool (use ``worker_pool``)."""
+    pool = WorkerPool(slot_count=2, max_slot_queue_size=5)
+    await pool.start()
+
+    yield pool
+
+    await pool.stop()
+
+
+@pytest_asyncio.fixture
+async def worker_pool(
+    _session_worker_pool: WorkerPool,
+) -> AsyncGenerator[WorkerPool, None]:
+    """Started WorkerPool shared across tests.
+
+    Pending tasks are discarded after each test.
+    """
+    yield _session_worker_pool
+
+    _session_worker_pool.clear()
@@ -1,29 +1,35 @@
 """Unit tests for ProcessMonitor service."""
 
 import asyncio
+import os
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock, mock_open, patch
 
 import pytest
 
 from services.process_monitor import (
+    _PROC_DEAD_STATES,
     ProcessMonitor,
     ProcessTerminationEvent,
     ProcessTerminationReason,
+    _read_proc_state,
 )
 
 
 class FakeClock:
     """Fake clock for testing."""
 
+    _DEFAULT_TIME = datetime(2025, 1, 1, 12, 0, 0)
+
     def __init__(self, initial_time: datetime = None):
-        self._time = initial_time or datetime(2025, 1, 1, 12, 0, 0)
+        self._time = initial_time or FakeClock._DEFAULT_TIME
+        self._ts_cache = self._time.timestamp()
 
     def now(self) -> datetime:
         return self._time
 
     def monotonic(self) -> float:
-        return self._time.timestamp()
+        return self._ts_cache
 
     async def sleep(self, seconds: float) -> None:
         await asyncio.sleep(0)  # Yield control without actual delay
@@ -48,25 +54,45 @@ class FakeLogger:
         self.messages.append({"level": "debug", "msg": msg, **kwargs})
 
 
-@pytest.fixture
+class RecordingAsyncCallback:
+    """Async callback that records its calls as (args, kwargs) tuples."""
+
+    def __init__(self):
+        self.calls: list[tuple[tuple, dict]] = []
+
+    async def __call__(self, *args, **kwargs) -> None:
+        self.calls.append((args, kwargs))
+
+
+@pytest.fixture(scope="module")
 def fake_clock() -> FakeClock:
     return FakeClock()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def fake_logger() -> FakeLogger:
     return FakeLogger()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def process_monitor(fake_clock: FakeClock, fake_logger: FakeLogger) -> ProcessMonitor:
     return ProcessMonitor(
         clock=fake_clock,
         logger=fake_logger,
-        max_slots=4,
+        max_slots=16,
     )
 
 
+@pytest.fixture(autouse=True)
+def _reset_process_monitor(
+    process_monitor: ProcessMonitor,
+    fake_logger: FakeLogger,
+) -> None:
+    """Reset the shared monitor and logger before each test."""
+    process_monitor.reset()
+    fake_logger.messages.clear()
+
+
 class TestProcessMonitor:
     """Tests for ProcessMonitor."""
 
@@ -122,6 +148,29 @@ class TestProcessMonitor:
         process_monitor.unwatch_slot(0)
         assert process_monitor.get_watched_slots() == {}
 
+    def test_reset_clears_watched_slots(self, process_monitor: ProcessMonitor):
+        """[TC-PROCESS_MONITOR-011] Reset - 감시 슬롯과 콜백을 모두 비운다.
+
+            테스트 목적:
+                reset 호출 시 감시 중인 슬롯과 종료 콜백이 초기화되는지 확인한다.
+
+            테스트 시나리오:
+                Given: 두 슬롯을 감시하고 종료 콜백을 등록한 뒤
+                When: reset을 호출하면
+                Then: 감시 목록이 비고 콜백이 해제된다.
+
+            Notes:
+                None
+            """
+        process_monitor.set_termination_callback(RecordingAsyncCallback())
+        process_monitor.watch_slot(0, 1234, is_running=True)
+        process_monitor.watch_slot(1, 5678)
+
+        process_monitor.reset()
+
+        assert process_monitor.get_watched_slots() == {}
+        assert process_monitor._on_termination is None
+
     def test_update_slot_running_state(self, process_monitor: ProcessMonitor):
         """[TC-PROCESS_MONITOR-004] Update slot running state - 테스트 시나리오를 검증한다.
 
@@ -180,7 +229,7 @@ class TestProcessMonitor:
             Notes:
                 None
             """
-        callback = AsyncMock()
+        callback = RecordingAsyncCallback()
         process_monitor.set_termination_callback(callback)
 
         process_monitor.watch_slot(0, 99999, is_running=True)  # Non-existent PID
@@ -188,8 +237,8 @@ class TestProcessMonitor:
         with patch("psutil.pid_exists", return_value=False):
             await process_monitor._check_processes()
 
-        callback.assert_called_once()
-        event = callback.call_args[0][0]
+        assert len(callback.calls) == 1
+        event = callback.calls[0][0][0]
         assert isinstance(event, ProcessTerminationEvent)
         assert event.slot_idx == 0
         assert event.pid == 99999
@@ -214,7 +263,7 @@ class TestProcessMonitor:
             Notes:
                 None
             """
-        callback = AsyncMock()
+        callback = RecordingAsyncCallback()
         process_monitor.set_termination_callback(callback)
 
         process_monitor.watch_slot(0, 1234, is_running=True)
@@ -223,14 +272,94 @@ class TestProcessMonitor:
         mock_process.status.return_value = "zombie"
 
         with patch("psutil.pid_exists", return_value=True):
-            with patch("psutil.Process", return_value=mock_process):
-                with patch("psutil.STATUS_ZOMBIE", "zombie"):
-                    await process_monitor._check_processes()
-
-        callback.assert_called_once()
-        event = callback.call_args[0][0]
+            with patch(
+                "services.process_monitor._read_proc_state", return_value=None
+            ):
+                with patch("psutil.Process", return_value=mock_process):
+                    with patch("psutil.STATUS_ZOMBIE", "zombie"):
+                        await process_monitor._check_processes()
+
+        assert len(callback.calls) == 1
+        event = callback.calls[0][0][0]
         assert event.reason == ProcessTerminationReason.PROCESS_CRASHED
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("proc_state", "expect_process_call"),
+        [("R", False), ("S", False), ("Z", True), (None, True)],
+        ids=["running", "sleeping", "zombie", "no_procfs"],
+    )
+    async def test_process_lookup_skipped_when_alive(
+        self,
+        process_monitor: ProcessMonitor,
+        proc_state: str | None,
+        expect_process_call: bool,
+    ):
+        """[TC-PROCESS_MONITOR-010] Alive fast path - 정상 상태면 psutil.Process를 생성하지 않는다.
+
+            테스트 목적:
+                procfs 상태 코드가 정상(R/S)이면 psutil.Process 생성을 생략하고,
+                좀비이거나 procfs를 읽을 수 없을 때만 psutil로 상태를 확인하는지 검증한다.
+
+            테스트 시나리오:
+                Given: PID가 존재하고 _read_proc_state가 지정 상태 코드를 반환할 때
+                When: _check_processes를 호출하면
+                Then: 상태 코드에 따라 psutil.Process 호출 여부가 달라진다
+
+            Notes:
+                None
+            """
+        process_monitor.watch_slot(0, 1234, is_running=True)
+
+        mock_process = MagicMock()
+        mock_process.status.return_value = "running"
+
+        with patch("psutil.pid_exists", return_value=True):
+            with patch("services.process_monitor._HAS_PROCFS", True):
+                with patch(
+                    "services.process_monitor._read_proc_state",
+                    return_value=proc_state,
+                ):
+                    with patch("psutil.Process", return_value=mock_process) as mock_cls:
+                        await process_monitor._check_processes()
+
+        assert mock_cls.called is expect_process_call
+        assert process_monitor.get_watched_slots() == {0: 1234}
+
+    @pytest.mark.asyncio
+    async def test_procfs_skipped_without_procfs(
+        self,
+        process_monitor: ProcessMonitor,
+    ):
+        """[TC-PROCESS_MONITOR-015] No procfs - procfs가 없는 플랫폼은 바로 psutil로 확인한다.
+
+            테스트 목적:
+                procfs가 없는 플랫폼(Windows 등)에서는 매 점검마다 /proc 읽기를
+                시도하지 않고 psutil.Process로만 상태를 확인하는지 검증한다.
+
+            테스트 시나리오:
+                Given: _HAS_PROCFS가 False이고 PID가 존재할 때
+                When: _check_processes를 호출하면
+                Then: _read_proc_state는 호출되지 않고 psutil.Process가 호출된다
+
+            Notes:
+                None
+            """
+        process_monitor.watch_slot(0, 1234, is_running=True)
+
+        mock_process = MagicMock()
+        mock_process.status.return_value = "running"
+
+        with patch("psutil.pid_exists", return_value=True):
+            with patch("services.process_monitor._HAS_PROCFS", False):
+                with patch("services.process_monitor._read_proc_state") as mock_read:
+                    with patch("psutil.Process", return_value=mock_process) as mock_cls:
+                        await process_monitor._check_processes()
+
+        mock_read.assert_not_called()
+        mock_cls.assert_called_once_with(1234)
+        assert process_monitor.get_watched_slots() == {0: 1234}
+
     @pytest.mark.asyncio
     async def test_slot_removed_after_termination(
         self,
@@ -249,7 +378,7 @@ class TestProcessMonitor:
             Notes:
                 None
             """
-        callback = AsyncMock()
+        callback = RecordingAsyncCallback()
         process_monitor.set_termination_callback(callback)
 
         process_monitor.watch_slot(0, 99999, is_running=True)
@@ -261,35 +390,117 @@ class TestProcessMonitor:
         assert 0 not in process_monitor.get_watched_slots()
 
     @pytest.mark.asyncio
+    @pytest.mark.parametrize("n_slots", [1, 4, 16])
     async def test_multiple_slots_monitoring(
         self,
         process_monitor: ProcessMonitor,
+        n_slots: int,
     ):
         """[TC-PROCESS_MONITOR-009] Multiple slots monitoring - 테스트 시나리오를 검증한다.
 
             테스트 목적:
-                Multiple slots monitoring 시나리오에서 기대 동작이 유지되는지 확인한다.
+                감시 슬롯 수에 관계없이 종료된 모든 슬롯이 한 번의 점검으로 정리되는지 확인한다.
 
             테스트 시나리오:
-                Given: 테스트 코드에서 준비한 기본 상태
-                When: test_multiple_slots_monitoring 케이스를 실행하면
-                Then: 단언문에 명시된 기대 결과가 충족된다.
+                Given: n_slots개 슬롯의 프로세스를 감시 중이고
+                When: 모든 PID가 사라진 상태에서 _check_processes를 호출하면
+                Then: 감시 목록이 비고 슬롯마다 콜백이 한 번씩 호출된다.
 
             Notes:
                 None
             """
-        callback = AsyncMock()
+        callback = RecordingAsyncCallback()
         process_monitor.set_termination_callback(callback)
 
-        process_monitor.watch_slot(0, 1001, is_running=True)
-        process_monitor.watch_slot(1, 1002, is_running=True)
+        for i in range(n_slots):
+            process_monitor.watch_slot(i, 1000 + i, is_running=True)
 
         # Simulate: all processes terminated
         with patch("psutil.pid_exists", return_value=False):
             await process_monitor._check_processes()
 
-        # Both slots should be removed
-        assert 0 not in process_monitor.get_watched_slots()
-        assert 1 not in process_monitor.get_watched_slots()
+        # All slots should be removed
+        assert process_monitor.get_watched_slots() == {}
         # Callback should be called for each terminated slot
-        assert callback.call_count == 2
+        assert len(callback.calls) == n_slots
+
+
+class TestReadProcState:
+    """Tests for _read_proc_state."""
+
+    @pytest.mark.skipif(
+        not os.path.exists(f"/proc/{os.getpid()}/stat"), reason="procfs 없음"
+    )
+    def test_current_process_is_alive(self):
+        """[TC-PROCESS_MONITOR-012] Current process - 실행 중인 프로세스는 종료 상태가 아니다.
+
+            테스트 목적:
+                실제 procfs에서 상태 코드를 읽어 종료 상태가 아닌 값을 반환하는지 확인한다.
+
+            테스트 시나리오:
+                Given: procfs가 있는 환경에서
+                When: 현재 프로세스 PID로 _read_proc_state를 호출하면
+                Then: 한 글자 상태 코드가 반환되고 _PROC_DEAD_STATES에 속하지 않는다.
+
+            Notes:
+                procfs가 없는 플랫폼에서는 건너뛴다.
+            """
+        state = _read_proc_state(os.getpid())
+
+        assert state is not None
+        assert len(state) == 1
+        assert state not in _PROC_DEAD_STATES
+
+    @pytest.mark.parametrize(
+        ("stat", "expected"),
+        [
+            (b"1234 (USB Test.exe) S 1 1234 1234 0 -1", "S"),
+            (b"1234 (weird) Z (name) R 1 1234 1234 0 -1", "R"),
+            (b"1234 (a) b)) Z 1 1234 1234 0 -1", "Z"),
+            (b"1234 (truncated)", None),
+            (b"garbage", None),
+        ],
+        ids=["spaces", "paren_in_comm", "trailing_parens", "truncated", "no_paren"],
+    )
+    def test_comm_with_spaces_and_parens(self, stat: bytes, expected: str | None):
+        """[TC-PROCESS_MONITOR-013] Comm parsing - comm의 공백/괄호와 무관하게 상태 코드를 읽는다.
+
+            테스트 목적:
+                comm 필드에 공백이나 ')'가 포함되어도 마지막 ')' 기준으로
+                상태 코드를 파싱하고, 잘린 데이터는 None을 반환하는지 확인한다.
+
+            테스트 시나리오:
+                Given: /proc/<pid>/stat 내용이 지정 바이트열일 때
+                When: _read_proc_state를 호출하면
+                Then: 기대한 상태 코드(또는 None)가 반환된다.
+
+            Notes:
+                None
+            """
+        with patch(
+            "services.process_monitor.open", mock_open(read_data=stat), create=True
+        ) as mocked:
+            assert _read_proc_state(1234) == expected
+
+        mocked.assert_called_once_with("/proc/1234/stat", "rb")
+
+    def test_unreadable_entry_returns_none(self):
+        """[TC-PROCESS_MONITOR-014] Unreadable entry - 읽기 실패 시 None을 반환한다.
+
+            테스트 목적:
+                procfs 항목을 열 수 없으면(없는 PID, 비 Linux 등) 예외 대신 None을 반환하는지 확인한다.
+
+            테스트 시나리오:
+                Given: open이 OSError를 발생시킬 때
+                When: _read_proc_state를 호출하면
+                Then: None이 반환된다.
+
+            Notes:
+                None
+            """
+        with patch(
+            "services.process_monitor.open",
+            side_effect=FileNotFoundError,
+            create=True,
+        ):
+            assert _read_proc_state(99999) is None
@@ -1,15 +1,10 @@
 """StateMonitor Unit Tests."""
 
-import asyncio
 import pytest
-from typing import Any
 
 from services.state_monitor import StateMonitor, SlotSnapshot
 from infrastructure.clock import FakeClock
 from infrastructure.state_store import FakeStateStore
-from infrastructure.window_finder import FakeWindowFinder
-
-from tests.conftest import FakeLogger
 
 
 class TestStateMonitorBasic:
@@ -39,6 +34,46 @@ class TestStateMonitorBasic:
         await state_monitor.stop()
         assert state_monitor.is_running is False
 
+    @pytest.mark.asyncio
+    async def test_reset_clears_cached_state(
+        self,
+        state_monitor: StateMonitor,
+        fake_state_store: FakeStateStore,
+    ) -> None:
+        """[TC-SMON-010] 초기화 - 캐시된 상태와 콜백을 비운다.
+
+        테스트 목적:
+            reset 호출 후 콜백이 해제되고, 이전 상태 캐시가 비워져 동일 상태도 변경으로 감지되는지 확인한다.
+
+        테스트 시나리오:
+            Given: change 콜백을 등록하고 상태를 한 번 폴링한 뒤
+            When: reset을 호출하고 새 콜백을 등록해 동일 상태로 다시 폴링하면
+            Then: 이전 콜백은 더 호출되지 않고 새 콜백이 한 번 호출된다
+
+        Notes:
+            None
+        """
+        old_changes: list[SlotSnapshot] = []
+        new_changes: list[SlotSnapshot] = []
+
+        async def on_old_change(snapshot: SlotSnapshot) -> None:
+            old_changes.append(snapshot)
+
+        async def on_new_change(snapshot: SlotSnapshot) -> None:
+            new_changes.append(snapshot)
+
+        state_monitor.set_change_callback(on_old_change)
+        fake_state_store.set_slot_state(0, {"status": "running", "progress": 50.0})
+        await state_monitor._poll_states()
+        assert len(old_changes) == 1
+
+        state_monitor.reset()
+        state_monitor.set_change_callback(on_new_change)
+        await state_monitor._poll_states()
+
+        assert len(old_changes) == 1
+        assert len(new_changes) == 1
+
     @pytest.mark.asyncio
     async def test_get_snapshot(
         self,
@@ -84,12 +119,12 @@ class TestStateMonitorBasic:
         """[TC-SMON-003] 전체 스냅샷 조회 - 모든 슬롯 상태를 반환한다.
 
         테스트 목적:
-            저장소에 기록된 여러 슬롯의 상태가 리스트로 반환되는지 확인한다.
+            저장소에 기록된 여러 슬롯의 상태가 슬롯 인덱스로 조회 가능한지 확인한다.
 
         테스트 시나리오:
             Given: 슬롯 0/1에 서로 다른 status가 기록돼 있고
-            When: get_all_snapshots를 호출하면
-            Then: 최소 두 개 이상의 스냅샷이 반환되고 각 슬롯 status가 기록값과 일치한다
+            When: get_snapshots_by_slot / get_all_snapshots를 호출하면
+            Then: 슬롯별 status가 기록값과 일치하고 리스트는 슬롯 순서를 따른다
 
         Notes:
             None
@@ -97,12 +132,11 @@ class TestStateMonitorBasic:
         fake_state_store.set_slot_state(0, {"status": "running"})
         fake_state_store.set_slot_state(1, {"status": "idle"})
 
-        snapshots = state_monitor.get_all_snapshots()
+        snaps = state_monitor.get_snapshots_by_slot()
 
-        assert len(snapshots) >= 2
-        statuses = {s.slot_idx: s.status for s in snapshots}
-        assert statuses[0] == "running"
-        assert statuses[1] == "idle"
+        assert snaps[0].status == "running"
+        assert snaps[1].status == "idle"
+        assert state_monitor.get_all_snapshots() == list(snaps.values())
 
 
 class TestStateMonitorChangeDetection:
@@ -141,7 +175,7 @@ class TestStateMonitorChangeDetection:
         assert changes[0].status == "idle"
         changes.clear()
 
-        fake_state_store.set_slot_state(0, {"status": "running", "progress": 10.0})
+        fake_state_store.patch_slot_state(0, status="running", progress=10.0)
         await state_monitor._poll_states()
 
         assert len(changes) == 1
@@ -183,102 +217,82 @@ class TestStateMonitorChangeDetection:
 
         assert len(changes) == 0
 
-
-class TestStateMonitorHangDetection:
-    """StateMonitor Hang 감지 테스트"""
-
     @pytest.mark.asyncio
-    async def test_hang_detection_triggered(
+    async def test_change_callback_on_error_message_only(
         self,
         state_monitor: StateMonitor,
         fake_state_store: FakeStateStore,
-        fake_clock: FakeClock,
     ) -> None:
-        """[TC-SMON-006] 진행 정지 감지 - 한계 초과 시 hang 콜백을 호출한다.
+        """[TC-SMON-009] 감시 필드 변화 - error_message만 바뀌어도 콜백이 호출된다.
 
         테스트 목적:
-            running 상태가 정체되어 진행률이 멈추면 hang 콜백이 호출되는지 검증한다.
+            감시 필드 튜플 비교가 status/progress 외 필드 변화도 감지하는지 검증한다.
 
         테스트 시나리오:
-            Given: hang 콜백을 등록하고 running 상태로 기록한 뒤
-            When: 시간을 threshold 이상 진전시키고 _poll_states를 호출하면
-            Then: hang 콜백이 한 번 호출되고 슬롯/지연 시간이 전달된다
+            Given: change 콜백을 등록하고 running 상태를 한 번 폴링한 뒤
+            When: error_message만 추가하고 _poll_states를 호출하면
+            Then: 콜백이 한 번 호출된다
 
         Notes:
             None
         """
-        hang_events: list[tuple[int, float]] = []
+        changes: list[SlotSnapshot] = []
 
-        async def on_hang(slot_idx: int, duration: float) -> None:
-            hang_events.append((slot_idx, duration))
+        async def on_change(snapshot: SlotSnapshot) -> None:
+            changes.append(snapshot)
 
-        state_monitor.set_hang_callback(on_hang, threshold_seconds=10.0)
+        state_monitor.set_change_callback(on_change)
 
         fake_state_store.set_slot_state(0, {"status": "running", "progress": 50.0})
         await state_monitor._poll_states()
+        changes.clear()
 
-        fake_clock.advance(seconds=15.0)
+        fake_state_store.set_slot_state(
+            0,
+            {"status": "running", "progress": 50.0, "error_message": "Timeout"},
+        )
         await state_monitor._poll_states()
 
-        assert len(hang_events) == 1
-        assert hang_events[0][0] == 0
-        assert hang_events[0][1] >= 10.0
-
-    @pytest.mark.asyncio
-    async def test_no_hang_when_progress_changes(
-        self,
-        state_monitor: StateMonitor,
-        fake_state_store: FakeStateStore,
-        fake_clock: FakeClock,
-    ) -> None:
-        """[TC-SMON-007] 진행 변화 시 hang 미발생 - 진행률이 변하면 콜백이 없다.
-
-        테스트 목적:
-            진행률이 업데이트되면 hang 콜백이 호출되지 않는지 검증한다.
-
-        테스트 시나리오:
-            Given: hang 콜백을 등록하고 running 상태로 기록한 뒤
-            When: 시간을 경과시키고 progress를 증가시킨 후 _poll_states를 호출하면
-            Then: hang 콜백이 호출되지 않는다
-
-        Notes:
-            None
-        """
-        hang_events: list[tuple[int, float]] = []
-
-        async def on_hang(slot_idx: int, duration: float) -> None:
-            hang_events.append((slot_idx, duration))
-
-        state_monitor.set_hang_callback(on_hang, threshold_seconds=10.0)
-
-        fake_state_store.set_slot_state(0, {"status": "running", "progress": 50.0})
-        await state_monitor._poll_states()
+        assert len(changes) == 1
+        assert changes[0].status == "running"
 
-        fake_clock.advance(seconds=15.0)
-        fake_state_store.set_slot_state(0, {"status": "running", "progress": 60.0})
-        await state_monitor._poll_states()
 
-        assert len(hang_events) == 0
+class TestStateMonitorHangDetection:
+    """StateMonitor Hang 감지 테스트"""
 
     @pytest.mark.asyncio
-    async def test_no_hang_when_idle(
+    @pytest.mark.parametrize(
+        "status,advance,new_progress,expect_hang",
+        [
+            ("running", 15.0, None, True),
+            ("running", 15.0, 60.0, False),
+            ("idle", 100.0, None, False),
+        ],
+        ids=["hang", "progress_resets", "idle"],
+    )
+    async def test_hang_detection(
         self,
         state_monitor: StateMonitor,
         fake_state_store: FakeStateStore,
         fake_clock: FakeClock,
+        status: str,
+        advance: float,
+        new_progress: float | None,
+        expect_hang: bool,
     ) -> None:
-        """[TC-SMON-008] Idle 상태 - 장시간 대기해도 hang 콜백이 없다.
+        """[TC-SMON-006] 진행 정지 감지 - 정체된 running 슬롯에서만 hang 콜백을 호출한다.
 
         테스트 목적:
-            idle 상태에서는 진행 정지로 간주하지 않아 hang 콜백이 발생하지 않는지 확인한다.
+            running 상태에서 진행률이 threshold 이상 멈추면 hang 콜백이 호출되고,
+            진행률이 변하거나 idle 상태인 경우에는 호출되지 않는지 검증한다.
 
         테스트 시나리오:
-            Given: 상태를 idle로 설정하고 hang 콜백을 등록한 뒤
-            When: 시간을 크게 경과시키고 _poll_states를 호출하면
-            Then: hang 콜백이 호출되지 않는다
+            Given: hang 콜백(threshold=10초)을 등록하고 초기 상태를 한 번 폴링한 뒤
+            When: 시간을 경과시키고(필요 시 progress 갱신) _poll_states를 호출하면
+            Then: hang: 콜백 1회(슬롯/지연 시간 전달), progress_resets/idle: 콜백 없음
 
         Notes:
-            None
+            구 TC-SMON-007(진행 변화), TC-SMON-008(Idle)을 파라미터 케이스로 통합
         """
         hang_events: list[tuple[int, float]] = []
 
@@ -287,10 +301,20 @@ class TestStateMonitorHangDetection:
 
         state_monitor.set_hang_callback(on_hang, threshold_seconds=10.0)
 
-        fake_state_store.set_slot_state(0, {"status": "idle", "progress": 0.0})
+        initial_progress = 50.0 if status == "running" else 0.0
+        fake_state_store.set_slot_state(
+            0, {"status": status, "progress": initial_progress}
+        )
         await state_monitor._poll_states()
 
-        fake_clock.advance(seconds=100.0)
+        fake_clock.advance(seconds=advance)
+        if new_progress is not None:
+            fake_state_store.patch_slot_state(0, progress=new_progress)
         await state_monitor._poll_states()
 
-        assert len(hang_events) == 0
+        if expect_hang:
+            assert len(hang_events) == 1
+            assert hang_events[0][0] == 0
+            assert hang_events[0][1] >= 10.0
+        else:
+            assert len(hang_events) == 0
@@ -1,17 +1,12 @@
 """TestExecutor Unit Tests."""
 
-from datetime import datetime
 import pytest
 
 from services.test_executor import TestExecutor, TestRequest, TestPhase
-from core.exceptions import WindowNotFoundError, TestStartError
+from core.exceptions import WindowNotFoundError
 from infrastructure.clock import FakeClock
 from infrastructure.state_store import FakeStateStore
-from infrastructure.window_finder import (
-    FakeWindowFinder,
-    FakeWindowHandle,
-    FakeControlHandle,
-)
+from infrastructure.window_finder import FakeWindowFinder
 
 from tests.conftest import FakeLogger
 
@@ -19,7 +14,6 @@ from tests.conftest import FakeLogger
 class TestTestExecutorConnection:
     """TestExecutor 연결 테스트"""
 
-    @pytest.mark.asyncio
     async def test_connect_success(
         self,
         test_executor: TestExecutor,
@@ -42,10 +36,8 @@ class TestTestExecutorConnection:
 
         assert result is True
         assert test_executor.is_connected is True
-        info_logs = fake_logger.get_logs("info")
-        assert any("Connected" in log["message"] for log in info_logs)
+        assert fake_logger.has_message("info", "Connected")
 
-    @pytest.mark.asyncio
     async def test_connect_failure_window_not_found(
         self,
         fake_window_finder: FakeWindowFinder,
@@ -60,8 +52,8 @@ class TestTestExecutorConnection:
 
         테스트 시나리오:
             Given: 창 패턴이 매칭되지 않는 FakeWindowFinder로 TestExecutor를 만들고
-            When: connect(timeout=1.0)을 호출하면
-            Then: False를 반환하며 is_connected는 False다
+            When: connect(timeout=0.01)을 호출하면
+            Then: False를 반환하며 is_connected는 False이고, 창 검색은 2회로 끝난다
 
         Notes:
             None
@@ -73,12 +65,14 @@ class TestTestExecutorConnection:
             logger=fake_logger,
         )
 
-        result = await executor.connect(timeout=1.0)
+        # FakeWindowFinder는 대기 없이 즉시 반환하므로 timeout은 논리값일 뿐이다
+        result = await executor.connect(timeout=0.01)
 
         assert result is False
         assert executor.is_connected is False
+        # 재시도 루프 없이 기존 창 확인 + 실행 후 확인, 총 2회만 검색한다
+        assert len(fake_window_finder.find_window_calls) == 2
 
-    @pytest.mark.asyncio
     async def test_disconnect(self, test_executor: TestExecutor) -> None:
         """[TC-EXEC-003] 연결 해제 - 연결 후 disconnect하면 플래그가 내려간다.
 
@@ -104,7 +98,6 @@ class TestTestExecutorConnection:
 class TestTestExecutorStartTest:
     """TestExecutor start_test 테스트"""
 
-    @pytest.mark.asyncio
     async def test_start_test_success(
         self,
         test_executor: TestExecutor,
@@ -137,29 +130,36 @@ class TestTestExecutorStartTest:
         assert state is not None
         assert state["status"] == TestPhase.RUNNING.value
 
-    @pytest.mark.asyncio
-    async def test_start_test_not_connected(
+    @pytest.mark.parametrize(
+        "action",
+        [
+            lambda ex, req: ex.start_test(req),
+            lambda ex, req: ex.stop_test(req.slot_idx),
+        ],
+        ids=["start_test", "stop_test"],
+    )
+    async def test_not_connected_raises(
         self,
         test_executor: TestExecutor,
         sample_test_request: TestRequest,
+        action,
     ) -> None:
-        """[TC-EXEC-005] 미연결 상태 - start_test 호출 시 예외를 발생시킨다.
+        """[TC-EXEC-005] 미연결 상태 - start_test/stop_test 호출 시 예외를 발생시킨다.
 
         테스트 목적:
-            연결되지 않은 상태에서 start_test 호출 시 WindowNotFoundError가 발생하는지 확인한다.
+            연결되지 않은 상태에서 start_test/stop_test 호출 시 WindowNotFoundError가 발생하는지 확인한다.
 
         테스트 시나리오:
             Given: connect를 수행하지 않은 TestExecutor가 있고
-            When: start_test를 호출하면
+            When: start_test 또는 stop_test를 호출하면
             Then: WindowNotFoundError가 발생한다
 
         Notes:
-            None
+            TC-EXEC-008(미연결 상태 중지)을 파라미터로 통합했다.
         """
         with pytest.raises(WindowNotFoundError):
-            await test_executor.start_test(sample_test_request)
+            await action(test_executor, sample_test_request)
 
-    @pytest.mark.asyncio
     async def test_start_test_state_transitions(
         self,
         test_executor: TestExecutor,
@@ -198,7 +198,6 @@ class TestTestExecutorStartTest:
 class TestTestExecutorStopTest:
     """TestExecutor stop_test 테스트"""
 
-    @pytest.mark.asyncio
     async def test_stop_test_success(
         self,
         test_executor: TestExecutor,
@@ -225,29 +224,10 @@ class TestTestExecutorStopTest:
         assert result.success is True
         assert result.phase == TestPhase.STOPPED
 
-    @pytest.mark.asyncio
-    async def test_stop_test_not_connected(self, test_executor: TestExecutor) -> None:
-        """[TC-EXEC-008] 미연결 상태 중지 - stop_test가 예외를 발생시킨다.
-
-        테스트 목적:
-            연결되지 않은 상태에서 stop_test 호출 시 WindowNotFoundError가 발생하는지 확인한다.
-
-        테스트 시나리오:
-            Given: connect를 수행하지 않은 TestExecutor가 있고
-            When: stop_test를 호출하면
-            Then: WindowNotFoundError가 발생한다
-
-        Notes:
-            None
-        """
-        with pytest.raises(WindowNotFoundError):
-            await test_executor.stop_test(0)
-
 
 class TestTestExecutorWithMockTime:
     """시간 Mock을 사용하는 테스트"""
 
-    @pytest.mark.asyncio
     async def test_execution_duration_tracking(
         self,
         test_executor: TestExecutor,
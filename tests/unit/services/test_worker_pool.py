@@ -1,20 +1,15 @@
-import asyncio
-
-import pytest
-
 from services.worker_pool import WorkerPool, WorkerPriority
 
 
-@pytest.mark.asyncio
-async def test_slot_tasks_respect_priority() -> None:
+async def test_slot_tasks_respect_priority(worker_pool: WorkerPool) -> None:
     """[TC-WORKER-001] 슬롯 작업 우선순위 - HIGH가 NORMAL보다 먼저 실행된다.
 
     테스트 목적:
         동일 슬롯 큐에서 우선순위 HIGH 작업이 NORMAL 작업보다 먼저 소비되는지 확인한다.
 
     테스트 시나리오:
-        Given: 슬롯 0에 NORMAL 작업과 HIGH 작업을 순서대로 enqueue 하고
-        When: 워커 풀을 실행한 뒤 처리 순서를 기록하면
+        Given: 실행 중인 워커 풀의 슬롯 0에 NORMAL 작업과 HIGH 작업을 순서대로 enqueue 하고
+        When: 모든 작업이 처리될 때까지 join한 뒤 처리 순서를 확인하면
         Then: 결과 기록에서 HIGH가 NORMAL보다 먼저 나타난다
 
     Notes:
@@ -25,29 +20,24 @@ async def test_slot_tasks_respect_priority() -> None:
     async def record(name: str) -> None:
         results.append(name)
 
-    pool = WorkerPool(slot_count=1, max_slot_queue_size=5)
-    await pool.start()
-
-    await pool.enqueue_slot(
+    await worker_pool.enqueue_slot(
         slot_idx=0,
         name="normal",
         coro_factory=lambda: record("normal"),
         priority=WorkerPriority.NORMAL,
     )
-    await pool.enqueue_slot(
+    await worker_pool.enqueue_slot(
         slot_idx=0,
         name="high",
         coro_factory=lambda: record("high"),
         priority=WorkerPriority.HIGH,
     )
 
-    await asyncio.sleep(0.05)
-    await pool.stop()
+    await worker_pool.join()
 
-    assert results[:2] == ["high", "normal"]
+    assert results == ["high", "normal"]
 
 
-@pytest.mark.asyncio
 async def test_top_worker_drops_when_full() -> None:
     """[TC-WORKER-002] Top 큐 포화 시 드랍 - drop_if_full 옵션을 따른다.
 
@@ -81,9 +71,41 @@ async def test_top_worker_drops_when_full() -> None:
     )
 
     await pool.start()
-    await asyncio.sleep(0.05)
+    await pool.join()
     await pool.stop()
 
     assert ok_first is True
     assert ok_second is False
     assert "first" in executed
+
+
+async def test_clear_discards_pending_tasks() -> None:
+    """[TC-WORKER-003] 대기 작업 제거 - clear 후에는 적재된 작업이 실행되지 않는다.
+
+    테스트 목적:
+        clear 호출 시 Top/Scheduler 큐에 대기 중인 작업이 실행 없이 제거되는지 검증한다.
+
+    테스트 시나리오:
+        Given: 시작하지 않은 풀에 Top 작업과 슬롯 작업을 enqueue 하고
+        When: clear 후 풀을 시작해 join 하면
+        Then: join이 즉시 반환되고 실행된 작업이 없다
+
+    Notes:
+        None
+    """
+    executed: list[str] = []
+
+    async def record(name: str) -> None:
+        executed.append(name)
+
+    pool = WorkerPool(slot_count=1)
+    await pool.enqueue_top(name="top", coro_factory=lambda: record("top"))
+    await pool.enqueue_slot(slot_idx=0, name="slot", coro_factory=lambda: record("slot"))
+
+    pool.clear()
+
+    await pool.start()
+    await pool.join()
+    await pool.stop()
+
+    assert executed == []
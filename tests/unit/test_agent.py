@@ -2,12 +2,15 @@
 
 import asyncio
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock, patch
 
 from main import Agent, setup_container
 from core.container import Container
 from core.protocols import IWindowFinder, IStateStore, IClock
 
+# 파라미터 목록에서 "주입된 test_container"를 가리키는 표식
+_INJECTED_CONTAINER = object()
+
 
 class TestSetupContainer:
     """setup_container 테스트 클래스"""
@@ -61,55 +64,51 @@ class TestSetupContainer:
 class TestAgent:
     """Agent 클래스 테스트"""
 
-    def test_agent_accepts_custom_container(
-        self,
-        test_container: Container,
-    ) -> None:
-        """[TC-AGENT-003] 사용자 컨테이너 주입 - 전달된 컨테이너를 사용한다.
-
-        테스트 목적:
-            Agent 생성 시 외부에서 전달한 컨테이너가 내부에 그대로 설정되는지 확인한다.
-
-        테스트 시나리오:
-            Given: 미리 구성된 test_container가 있고
-            When: Agent(container=test_container)로 생성하면
-            Then: agent.container가 전달한 컨테이너 객체와 동일하다
-
-        Notes:
-            None
-        """
-        agent = Agent(container=test_container)
-
-        assert agent.container is test_container
-
-    def test_agent_initial_state(
+    @pytest.fixture
+    def built_agent(self, test_container: Container) -> Agent:
+        """Agent built with the test container."""
+        return Agent(container=test_container)
+
+    @pytest.mark.parametrize(
+        "attr,expected",
+        [
+            ("container", _INJECTED_CONTAINER),
+            ("is_running", False),
+            ("ws_client", None),
+            ("test_executor", None),
+            ("state_monitor", None),
+        ],
+    )
+    def test_agent_initial_contract(
         self,
+        built_agent: Agent,
         test_container: Container,
+        attr: str,
+        expected: object,
     ) -> None:
-        """[TC-AGENT-004] 초기 상태 - 기본 필드가 None/False로 설정된다.
+        """[TC-AGENT-003] 초기 계약 - 주입된 컨테이너와 비활성 초기 상태를 가진다.
 
         테스트 목적:
-            Agent 초기 생성 시 실행 플래그와 서비스 객체가 비활성/None인지 확인한다.
+            Agent 생성 시 외부에서 전달한 컨테이너가 그대로 설정되고,
+            실행 플래그와 서비스 객체가 비활성/None인지 확인한다.
 
         테스트 시나리오:
-            Given: 컨테이너를 전달해 Agent를 생성하고
-            When: is_running/ws_client/test_executor/state_monitor를 조회하면
-            Then: is_running은 False이며 나머지는 None이다
+            Given: 미리 구성된 test_container로 Agent를 생성하고
+            When: container/is_running/ws_client/test_executor/state_monitor를 조회하면
+            Then: container는 전달한 객체와 동일하고, is_running은 False, 나머지는 None이다
 
         Notes:
-            None
+            구 TC-AGENT-004(초기 상태)를 파라미터 케이스로 통합
         """
-        agent = Agent(container=test_container)
+        if expected is _INJECTED_CONTAINER:
+            expected = test_container
 
-        assert agent.is_running is False
-        assert agent.ws_client is None
-        assert agent.test_executor is None
-        assert agent.state_monitor is None
+        assert getattr(built_agent, attr) is expected
 
-    @pytest.mark.asyncio
     async def test_agent_start_initializes_services(
         self,
         test_container: Container,
+        ws_client_mock: MagicMock,
     ) -> None:
         """[TC-AGENT-005] 서비스 초기화 - start 호출 시 WS 클라이언트를 준비한다.
 
@@ -117,35 +116,47 @@ class TestAgent:
             Agent.start 실행 시 WebSocketClient가 생성되고 실행 루프를 시작하는지 검증한다.
 
         테스트 시나리오:
-            Given: 컨테이너가 주입된 Agent와 WebSocketClient를 Mock 패치하고
-            When: agent.start를 호출 후 타임아웃 전에 stop을 예약하면
-            Then: WebSocketClient가 한 번 생성 호출된다
+            Given: 컨테이너가 주입된 Agent와 stop 신호까지 대기하는 WebSocketClient Mock이 있고
+            When: agent.start를 태스크로 실행해 WS run 호출을 확인한 뒤 stop하면
+            Then: WebSocketClient가 한 번 생성 호출되고 start가 타이머 없이 종료된다
 
         Notes:
             None
         """
         agent = Agent(container=test_container)
+        ws_started = asyncio.Event()
+        stop_event = asyncio.Event()
 
-        with patch("main.WebSocketClient") as mock_ws_class:
-            mock_ws_instance = MagicMock()
-            mock_ws_instance.run = AsyncMock()
-            mock_ws_instance.disconnect = AsyncMock()
-            mock_ws_class.return_value = mock_ws_instance
+        async def run_until_stopped(*args, **kwargs) -> None:
+            ws_started.set()
+            await stop_event.wait()
 
-            async def stop_after_init():
-                await agent.stop()
+        ws_client_mock.run.side_effect = run_until_stopped
 
-            asyncio.get_event_loop().call_later(
-                0.1, lambda: asyncio.create_task(stop_after_init())
+        with patch("main.WebSocketClient") as mock_ws_class:
+            mock_ws_class.return_value = ws_client_mock
+
+            task = asyncio.create_task(agent.start())
+            # start()가 WS run 전에 실패하면 이벤트 대기 대신 예외로 즉시 실패시킨다
+            started_waiter = asyncio.create_task(ws_started.wait())
+            await asyncio.wait(
+                {task, started_waiter},
+                timeout=1.0,
+                return_when=asyncio.FIRST_COMPLETED,
             )
-
-            try:
-                await asyncio.wait_for(agent.start(), timeout=1.0)
-            except asyncio.TimeoutError:
-                await agent.stop()
+            started_waiter.cancel()
+            if task.done():
+                task.result()
+            assert ws_started.is_set(), "WebSocketClient.run was not reached in time"
 
             mock_ws_class.assert_called_once()
 
+            stop_event.set()
+            await agent.stop()
+            await task
+
+        assert agent.is_running is False
+
     def test_agent_uses_default_container_if_not_provided(self) -> None:
         """[TC-AGENT-006] 기본 컨테이너 사용 - 인자가 없으면 setup_container를 호출한다.
 
@@ -160,14 +171,16 @@ class TestAgent:
         Notes:
             None
         """
+        # identity 비교만 하므로 spec Mock 대신 단순 객체로 충분하다
+        stub_container = object()
+
         with patch("main.setup_container") as mock_setup:
-            mock_container = MagicMock(spec=Container)
-            mock_setup.return_value = mock_container
+            mock_setup.return_value = stub_container
 
             agent = Agent(container=None)
 
             mock_setup.assert_called_once()
-            assert agent._container is mock_container
+            assert agent._container is stub_container
 
 
 class TestAgentMessageHandlers:
@@ -182,7 +195,6 @@ class TestAgentMessageHandlers:
         agent = Agent(container=test_container)
         return agent
 
-    @pytest.mark.asyncio
     async def test_handle_start_test_without_executor(
         self,
         agent_with_mocks: Agent,
@@ -204,7 +216,6 @@ class TestAgentMessageHandlers:
 
         await agent_with_mocks._handle_start_test({"slot_idx": 0, "config": {}})
 
-    @pytest.mark.asyncio
     async def test_handle_stop_test_without_executor(
         self,
         agent_with_mocks: Agent,
@@ -226,7 +237,6 @@ class TestAgentMessageHandlers:
 
         await agent_with_mocks._handle_stop_test({"slot_idx": 0})
 
-    @pytest.mark.asyncio
     async def test_handle_config_update(
         self,
         agent_with_mocks: Agent,
@@ -3,11 +3,17 @@
 import re
 import pytest
 
-from config.constants import ProcessState, TestPhase as TestPhaseEnum
+from config.constants import (
+    ProcessState,
+    TestPhase as TestPhaseEnum,
+)
+from domain import determine_status
 
 # Alias for readability in parametrized cases
 TestPhase = TestPhaseEnum
 
+_PROGRESS_RE = re.compile(r"(\d+)/(\d+)")
+
 
 class TestProcessState:
     """ProcessState.from_text() tests."""
@@ -24,6 +30,7 @@ class TestProcessState:
             ("idle", ProcessState.IDLE),
             ("PASS", ProcessState.PASS),
             ("pass", ProcessState.PASS),
+            (" Stop ", ProcessState.STOP),
             ("10/10 IDLE", ProcessState.IDLE),
             ("4/10  File Copy 35/88", ProcessState.UNKNOWN),
             ("", ProcessState.UNKNOWN),
@@ -50,6 +57,24 @@ class TestProcessState:
         result = ProcessState.from_text(value)
         assert result == expected
 
+    def test_from_text_case_variants_normalized(self) -> None:
+        """[TC-PARSE-005] ProcessState 정규화 - 대소문자/공백 변형이 같은 상태로 변환된다.
+
+        테스트 목적:
+            from_text가 정규화한 텍스트로 분류해 변형 텍스트가 같은 결과를 반환하는지 확인한다.
+
+        테스트 시나리오:
+            Given: 'IDLE', 'idle', ' Idle ' 변형 텍스트가 있고
+            When: 각각 from_text에 전달하면
+            Then: 모두 IDLE을 반환한다
+
+        Notes:
+            None
+        """
+        results = [ProcessState.from_text(t) for t in ("IDLE", "idle", " Idle ")]
+
+        assert results == [ProcessState.IDLE] * 3
+
 
 class TestTestPhase:
     """TestPhase.from_text() tests."""
@@ -67,6 +92,7 @@ class TestTestPhase:
             ("10/10 IDLE", TestPhase.IDLE),
             ("3/5 FileCompare 10/20", TestPhase.COMPARE),
             ("1/10  Contact Test 0/0", TestPhase.CONTACT),
+            ("3/5 file del 1/2", TestPhase.DELETE),
             ("", TestPhase.UNKNOWN),
             ("Unknown", TestPhase.UNKNOWN),
         ],
@@ -88,6 +114,26 @@ class TestTestPhase:
         result = TestPhase.from_text(text)
         assert result == expected
 
+    def test_from_text_ignores_progress_counters(self) -> None:
+        """[TC-PARSE-006] TestPhase 카운터 무시 - 진행 카운터가 달라도 같은 단계로 변환된다.
+
+        테스트 목적:
+            실행 중 계속 바뀌는 루프/파일 카운터가 단계 판별 결과에 영향을 주지 않는지 확인한다.
+
+        테스트 시나리오:
+            Given: 카운터만 다른 'File Copy'/'File Compare' 진행 텍스트가 있고
+            When: 각각 TestPhase.from_text에 전달하면
+            Then: 카운터와 관계없이 COPY/COMPARE를 반환한다
+
+        Notes:
+            None
+        """
+        copy_texts = ["1/10  File Copy 0/88", "4/10  File Copy 35/88", "10/10  File Copy 88/88"]
+        compare_texts = ["3/5 FileCompare 10/20", "5/5 FileCompare 20/20"]
+
+        assert [TestPhase.from_text(t) for t in copy_texts] == [TestPhase.COPY] * 3
+        assert [TestPhase.from_text(t) for t in compare_texts] == [TestPhase.COMPARE] * 2
+
 
 class TestProgressTextParsing:
     """Progress text parsing tests (loop info extraction)."""
@@ -122,7 +168,7 @@ class TestProgressTextParsing:
         Notes:
             None
         """
-        match = re.match(r"(\d+)/(\d+)", text.strip()) if text else None
+        match = _PROGRESS_RE.match(text.strip()) if text else None
 
         if expected_current is None:
             assert match is None
@@ -133,7 +179,7 @@ class TestProgressTextParsing:
 
 
 class TestDetermineStatus:
-    """Test _determine_status logic (ProcessState -> Frontend status)."""
+    """Test determine_status logic (ProcessState -> Frontend status)."""
 
     @pytest.mark.parametrize(
         "process_state,current_loop,total_loop,test_phase,expected_status",
@@ -172,31 +218,16 @@ class TestDetermineStatus:
         """[TC-PARSE-004] 상태 결정 - ProcessState/Phase/루프 조합을 FE 상태로 변환한다.
 
         테스트 목적:
-            _determine_status 로직이 프로세스 상태, 루프 진행도, Phase에 따라 예상 상태 문자열을 반환하는지 검증한다.
+            determine_status가 프로세스 상태, 루프 진행도, Phase에 따라 예상 상태 문자열을 반환하는지 검증한다.
 
         테스트 시나리오:
             Given: FAIL/STOP/PASS/TEST/IDLE/UNKNOWN 조합과 루프 완료 여부, Phase(IDLE/기타)를 준비하고
-            When: _determine_status 조건 분기를 수행하면
+            When: determine_status를 호출하면
             Then: 실패는 failed, 중지는 stopping, 완료+IDLE은 completed, PASS/TEST는 running, IDLE은 idle, UNKNOWN은 error를 반환한다
 
         Notes:
             None
         """
-        if process_state == ProcessState.FAIL:
-            status = "failed"
-        elif process_state == ProcessState.STOP:
-            status = "stopping"
-        elif (
-            total_loop > 0
-            and current_loop == total_loop
-            and test_phase == TestPhase.IDLE
-        ):
-            status = "completed"
-        elif process_state in (ProcessState.PASS, ProcessState.TEST):
-            status = "running"
-        elif process_state == ProcessState.IDLE:
-            status = "idle"
-        else:
-            status = "error"
+        status = determine_status(process_state, current_loop, total_loop, test_phase)
 
         assert status == expected_status
@@ -0,0 +1 @@
+"""Utils unit tests package."""
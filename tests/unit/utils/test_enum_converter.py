@@ -0,0 +1,66 @@
+"""Enum Converter Unit Tests."""
+
+from typing import Any
+
+import pytest
+
+from config.constants import TestCapacity, TestFile, TestMethod, TestPreset
+from utils.enum_converter import to_capacity, to_enum, to_file, to_method, to_preset
+
+
+class TestToEnum:
+    """to_enum 및 래퍼 함수 테스트"""
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            ("32GB", TestCapacity.GB_32),
+            ("1TB", TestCapacity.TB_1),
+            (TestCapacity.TB_1, TestCapacity.TB_1),
+            ("invalid", TestCapacity.GB_32),
+            ("", TestCapacity.GB_32),
+            (None, TestCapacity.GB_32),
+            (["32GB"], TestCapacity.GB_32),
+        ],
+        ids=["valid", "valid_1tb", "member", "invalid", "empty", "none", "unhashable"],
+    )
+    def test_to_enum(self, value: Any, expected: TestCapacity) -> None:
+        """[TC-ENUMCONV-001] 문자열 변환 - 유효한 값은 멤버로, 그 외는 기본값으로 변환한다.
+
+        테스트 목적:
+            to_enum이 유효한 값/멤버는 해당 멤버로, 잘못된 값·None·해시 불가능한 값은 기본값으로 변환하는지 검증한다.
+
+        테스트 시나리오:
+            Given: 유효한 용량 문자열, Enum 멤버, 잘못된 문자열, 빈 문자열, None, 리스트를 준비하고
+            When: to_enum(value, TestCapacity, TestCapacity.GB_32)를 호출하면
+            Then: 유효한 입력은 해당 멤버를, 나머지는 GB_32를 반환한다
+
+        Notes:
+            None
+        """
+        assert to_enum(value, TestCapacity, TestCapacity.GB_32) is expected
+
+    def test_wrappers_use_their_defaults(self) -> None:
+        """[TC-ENUMCONV-002] 래퍼 기본값 - 각 변환 함수가 고유 기본값을 사용한다.
+
+        테스트 목적:
+            to_capacity/to_method/to_preset/to_file이 올바른 Enum과 기본값으로 변환하는지 확인한다.
+
+        테스트 시나리오:
+            Given: 각 Enum의 유효한 값과 잘못된 값이 있고
+            When: 각 래퍼 함수를 호출하면
+            Then: 유효한 값은 멤버로, 잘못된 값은 GB_32/ZERO_HR/FULL/PHOTO로 변환된다
+
+        Notes:
+            None
+        """
+        assert to_capacity("1TB") is TestCapacity.TB_1
+        assert to_method(TestMethod.ZERO_HR.value) is TestMethod.ZERO_HR
+        assert to_preset(TestPreset.FULL.value) is TestPreset.FULL
+        assert to_file("MP3") is TestFile.MP3
+        assert (to_capacity("x"), to_method("x"), to_preset("x"), to_file("x")) == (
+            TestCapacity.GB_32,
+            TestMethod.ZERO_HR,
+            TestPreset.FULL,
+            TestFile.PHOTO,
+        )
@@ -0,0 +1,563 @@
+"""Structured Logging Unit Tests."""
+
+import json
+import logging
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Generator
+
+import pytest
+
+import utils.logging as logging_module
+from core.protocols import ILogger
+from utils.logging import (
+    ContextFilter,
+    ContextLogger,
+    JSONFormatter,
+    StructlogLoggerAdapter,
+    TextFormatter,
+    _orjson_dumps,
+    _stdlib_dumps,
+    bind_context,
+    clear_context,
+    get_ilogger,
+    get_logger,
+    setup_logging,
+    unbind_context,
+)
+
+# 2025-01-01T12:00:00Z
+_EPOCH_2025 = 1735732800
+
+
+def _make_record(created: float = _EPOCH_2025, **attrs: Any) -> logging.LogRecord:
+    """Build a LogRecord with a fixed creation time."""
+    record = logging.LogRecord(
+        name="test.logger",
+        level=logging.INFO,
+        pathname=__file__,
+        lineno=10,
+        msg="hello",
+        args=None,
+        exc_info=None,
+        func="test_func",
+    )
+    record.created = created
+    record.msecs = (created - int(created)) * 1000
+    record.__dict__.update(attrs)
+    return record
+
+
+class TestJSONFormatter:
+    """JSONFormatter 테스트"""
+
+    def test_timestamp_uses_record_created(self) -> None:
+        """[TC-LOG-001] 타임스탬프 - 레코드 생성 시각을 UTC 밀리초로 기록한다.
+
+        테스트 목적:
+            JSONFormatter가 포맷 시점이 아닌 record.created를 ISO 8601 UTC 문자열로 출력하는지 확인한다.
+
+        테스트 시나리오:
+            Given: created가 2025-01-01T12:00:00.125Z인 레코드가 있고
+            When: JSONFormatter로 포맷하면
+            Then: timestamp 필드가 '2025-01-01T12:00:00.125Z'이다
+
+        Notes:
+            None
+        """
+        formatter = JSONFormatter()
+
+        data = json.loads(formatter.format(_make_record(_EPOCH_2025 + 0.125)))
+
+        assert data["timestamp"] == "2025-01-01T12:00:00.125Z"
+
+    def test_timestamp_cache_follows_second_boundary(self) -> None:
+        """[TC-LOG-002] 타임스탬프 캐시 - 초가 바뀌면 캐시 문자열을 갱신한다.
+
+        테스트 목적:
+            초 단위 타임스탬프 캐시가 같은 초에서는 재사용되고 다음 초에서 갱신되는지 검증한다.
+
+        테스트 시나리오:
+            Given: 같은 초의 두 레코드와 다음 초의 레코드가 있고
+            When: 같은 JSONFormatter로 순서대로 포맷하면
+            Then: 밀리초만 다른 두 값과 다음 초 값이 각각 올바르게 출력된다
+
+        Notes:
+            None
+        """
+        formatter = JSONFormatter()
+
+        stamps = [
+            json.loads(formatter.format(_make_record(created)))["timestamp"]
+            for created in (_EPOCH_2025 + 0.25, _EPOCH_2025 + 0.75, _EPOCH_2025 + 1.5)
+        ]
+
+        assert stamps == [
+            "2025-01-01T12:00:00.250Z",
+            "2025-01-01T12:00:00.750Z",
+            "2025-01-01T12:00:01.500Z",
+        ]
+
+    def test_serializers_produce_identical_output(self) -> None:
+        """[TC-LOG-003] JSON 직렬화 - orjson과 표준 json 경로의 출력이 같다.
+
+        테스트 목적:
+            orjson 미설치 환경의 표준 json 폴백이 orjson과 동일한 문자열을 만드는지 확인한다.
+
+        테스트 시나리오:
+            Given: 한글 메시지, 숫자/None/bool 필드, 정수 키 딕셔너리, 64비트 초과 정수를 가진 로그 데이터가 있고
+            When: _orjson_dumps와 _stdlib_dumps로 각각 직렬화하면
+            Then: 두 결과 문자열이 같고 한글이 이스케이프되지 않는다
+
+        Notes:
+            orjson이 없으면 건너뛴다.
+        """
+        pytest.importorskip("orjson")
+        data = {"message": "슬롯 연결", "slot_idx": 3, "ratio": 0.5, "error": None, "ok": True}
+        slot_data = {**data, "slots": {0: "idle", 1: "running"}}
+        wide_data = {**slot_data, "bytes": 2**70}
+
+        assert _orjson_dumps(slot_data) == _stdlib_dumps(slot_data)
+        assert _orjson_dumps(wide_data) == _stdlib_dumps(wide_data)
+
+        result = _orjson_dumps(data)
+
+        assert result == _stdlib_dumps(data)
+        assert "슬롯 연결" in result
+
+    def test_extras_read_without_context_filter(self) -> None:
+        """[TC-LOG-015] 추가 필드 직접 수집 - ContextFilter 없이도 추가 속성을 출력한다.
+
+        테스트 목적:
+            JSONFormatter가 레코드 속성을 한 번 순회해 추가 필드를 직접 모으는지 확인한다.
+
+        테스트 시나리오:
+            Given: ContextFilter를 거치지 않은 slot_idx/_private 속성을 가진 레코드가 있고
+            When: JSONFormatter로 포맷하면
+            Then: slot_idx는 출력되고 _private과 extra_fields는 출력되지 않는다
+
+        Notes:
+            None
+        """
+        record = _make_record(slot_idx=5, _private="hidden")
+
+        data = json.loads(JSONFormatter().format(record))
+
+        assert data["slot_idx"] == 5
+        assert "_private" not in data
+        assert "extra_fields" not in data
+
+
+class TestContextFilter:
+    """ContextFilter 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def _clear_context(self) -> Generator[None, None, None]:
+        """Start and end each test with an empty logging context."""
+        clear_context()
+        yield
+        clear_context()
+
+    def test_filter_collects_custom_attributes(self) -> None:
+        """[TC-LOG-004] 추가 필드 수집 - 표준/비공개 속성을 제외한 속성만 extra_fields에 담는다.
+
+        테스트 목적:
+            ContextFilter가 extra={...}로 추가된 속성만 extra_fields로 모으는지 확인한다.
+
+        테스트 시나리오:
+            Given: slot_idx, drive 속성과 '_private' 속성을 가진 레코드가 있고
+            When: ContextFilter.filter를 호출하면
+            Then: True를 반환하고 extra_fields는 slot_idx/drive만 포함한다
+
+        Notes:
+            None
+        """
+        record = _make_record(slot_idx=2, drive="E", _private="hidden")
+
+        assert ContextFilter().filter(record) is True
+        assert record.extra_fields == {"slot_idx": 2, "drive": "E"}
+
+    def test_filter_shares_empty_fields_when_nothing_to_merge(self) -> None:
+        """[TC-LOG-005] 빠른 경로 - 병합할 내용이 없으면 공유 빈 매핑을 사용한다.
+
+        테스트 목적:
+            바인딩된 컨텍스트와 추가 속성이 모두 없을 때 레코드마다 dict를 만들지 않는지 확인한다.
+
+        테스트 시나리오:
+            Given: 컨텍스트가 비어 있고 추가 속성이 없는 두 레코드가 있고
+            When: 각각 ContextFilter.filter를 호출하면
+            Then: 두 레코드의 extra_fields는 같은 빈 객체이다
+
+        Notes:
+            None
+        """
+        context_filter = ContextFilter()
+        first, second = _make_record(), _make_record()
+
+        context_filter.filter(first)
+        context_filter.filter(second)
+
+        assert first.extra_fields == {}
+        assert first.extra_fields is second.extra_fields
+
+    def test_filter_does_not_mutate_shared_empty_fields(self) -> None:
+        """[TC-LOG-006] 공유 매핑 보호 - 재필터링 시 새 dict에 추가 필드를 담는다.
+
+        테스트 목적:
+            공유 빈 매핑을 받은 레코드에 속성이 생긴 뒤 다시 필터링해도 공유 객체가 오염되지 않는지 검증한다.
+
+        테스트 시나리오:
+            Given: 추가 속성 없이 한 번 필터링된 레코드가 있고
+            When: 레코드에 slot_idx 속성을 붙여 같은 레코드를 다시 필터링하면
+            Then: 레코드는 slot_idx를 가진 새 dict를 갖고 새 레코드의 extra_fields는 여전히 비어 있다
+
+        Notes:
+            핸들러가 여러 개라 필터가 두 번 적용되는 경우를 모사한다.
+        """
+        context_filter = ContextFilter()
+        record = _make_record()
+        context_filter.filter(record)
+
+        record.slot_idx = 1
+        context_filter.filter(record)
+        fresh = _make_record()
+        context_filter.filter(fresh)
+
+        assert record.extra_fields == {"slot_idx": 1}
+        assert fresh.extra_fields == {}
+
+    def test_filter_leaves_bound_context_to_formatters(self) -> None:
+        """[TC-LOG-007] 컨텍스트 분리 - 바인딩된 컨텍스트는 extra_fields에 복사하지 않는다.
+
+        테스트 목적:
+            컨텍스트 병합이 포맷터로 옮겨져 필터가 레코드마다 컨텍스트를 복사하지 않는지 확인한다.
+
+        테스트 시나리오:
+            Given: bind_context(agent_name=...)로 컨텍스트가 바인딩되어 있고
+            When: 추가 속성이 없는 레코드를 필터링하면
+            Then: extra_fields는 비어 있다
+
+        Notes:
+            None
+        """
+        bind_context(agent_name="agent-1")
+        record = _make_record()
+
+        ContextFilter().filter(record)
+
+        assert record.extra_fields == {}
+
+
+class TestBoundContextFormatting:
+    """바인딩된 컨텍스트 포맷 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def _clear_context(self) -> Generator[None, None, None]:
+        """Start and end each test with an empty logging context."""
+        clear_context()
+        yield
+        clear_context()
+
+    @staticmethod
+    def _format_json(record: logging.LogRecord) -> dict[str, Any]:
+        """Filter and format a record, returning the parsed JSON object."""
+        ContextFilter().filter(record)
+        return json.loads(JSONFormatter().format(record))
+
+    def test_json_includes_bound_context(self) -> None:
+        """[TC-LOG-008] JSON 컨텍스트 - 미리 직렬화한 컨텍스트가 출력에 포함된다.
+
+        테스트 목적:
+            bind_context로 바인딩한 값이 추가 필드와 함께 JSON 로그에 포함되는지 확인한다.
+
+        테스트 시나리오:
+            Given: agent_name/agent_version이 바인딩되어 있고 slot_idx 추가 필드를 가진 레코드가 있고
+            When: JSONFormatter로 포맷하면
+            Then: 세 필드가 모두 출력되고 unbind_context 이후에는 agent_version이 빠진다
+
+        Notes:
+            None
+        """
+        bind_context(agent_name="agent-1", agent_version="1.2")
+
+        data = self._format_json(_make_record(slot_idx=0))
+        unbind_context("agent_version")
+        after_unbind = self._format_json(_make_record())
+
+        assert (data["agent_name"], data["agent_version"], data["slot_idx"]) == ("agent-1", "1.2", 0)
+        assert after_unbind["agent_name"] == "agent-1"
+        assert "agent_version" not in after_unbind
+
+    def test_json_extra_field_overrides_context(self) -> None:
+        """[TC-LOG-009] 키 충돌 - 추가 필드가 컨텍스트보다, 컨텍스트가 기본 필드보다 우선한다.
+
+        테스트 목적:
+            컨텍스트와 기본/추가 필드 키가 겹칠 때 기존 병합 우선순위와 키 유일성이 유지되는지 검증한다.
+
+        테스트 시나리오:
+            Given: agent_name과 module이 바인딩되어 있고 agent_name 추가 필드를 가진 레코드가 있고
+            When: JSONFormatter로 포맷하면
+            Then: agent_name은 추가 필드 값, module은 컨텍스트 값이며 각 키는 한 번만 나타난다
+
+        Notes:
+            None
+        """
+        bind_context(agent_name="bound", module="ctx-module")
+        record = _make_record(agent_name="override")
+        ContextFilter().filter(record)
+
+        output = JSONFormatter().format(record)
+        data = json.loads(output)
+
+        assert data["agent_name"] == "override"
+        assert data["module"] == "ctx-module"
+        assert output.count('"agent_name"') == 1
+        assert output.count('"module"') == 1
+
+    def test_text_includes_bound_context(self) -> None:
+        """[TC-LOG-010] 텍스트 컨텍스트 - 컨텍스트 뒤에 추가 필드를 이어 출력한다.
+
+        테스트 목적:
+            TextFormatter가 바인딩된 컨텍스트와 추가 필드를 key=value 형태로 덧붙이는지 확인한다.
+
+        테스트 시나리오:
+            Given: agent_name이 바인딩되어 있고 slot_idx 추가 필드를 가진 레코드가 있고
+            When: TextFormatter로 포맷하면
+            Then: 출력이 '| agent_name=agent-1 slot_idx=3'으로 끝난다
+
+        Notes:
+            None
+        """
+        bind_context(agent_name="agent-1")
+        record = _make_record(slot_idx=3)
+        ContextFilter().filter(record)
+
+        output = TextFormatter().format(record)
+
+        assert output.endswith("| agent_name=agent-1 slot_idx=3")
+
+    def test_bind_non_json_value(self) -> None:
+        """[TC-LOG-020] JSON 미지원 값 - 바인딩이 실패하지 않고 텍스트 로그에 포함된다.
+
+        테스트 목적:
+            Path처럼 JSON으로 직렬화할 수 없는 값을 bind_context로 바인딩해도
+            예외가 발생하지 않고, 텍스트 포맷에서는 값이 그대로 출력되는지 확인한다.
+
+        테스트 시나리오:
+            Given: 로깅 컨텍스트가 비어 있고
+            When: bind_context(log_dir=Path("/tmp"))로 바인딩한 뒤 TextFormatter로 포맷하면
+            Then: 예외 없이 컨텍스트에 값이 저장되고 출력이 '| log_dir=/tmp'로 끝난다
+
+        Notes:
+            JSON 포맷에서는 사전 직렬화 없이 레코드마다 병합 경로를 사용한다.
+        """
+        bind_context(log_dir=Path("/tmp"))
+        record = _make_record()
+        ContextFilter().filter(record)
+
+        output = TextFormatter().format(record)
+
+        assert logging_module.agent_context_var.get() == ({"log_dir": Path("/tmp")}, "")
+        assert output.endswith("| log_dir=/tmp")
+
+
+class TestContextLogger:
+    """ContextLogger 테스트"""
+
+    def test_process_passes_standard_kwargs_through(self) -> None:
+        """[TC-LOG-011] 표준 인자 통과 - 추가 필드가 없으면 kwargs를 그대로 반환한다.
+
+        테스트 목적:
+            exc_info 등 표준 로깅 인자만 있을 때 process가 kwargs를 변경하지 않는지 확인한다.
+
+        테스트 시나리오:
+            Given: exc_info만 담은 kwargs가 있고
+            When: ContextLogger.process를 호출하면
+            Then: 같은 kwargs 객체가 내용 변경 없이 반환된다
+
+        Notes:
+            None
+        """
+        adapter = ContextLogger(logging.getLogger("test.context"), {})
+        kwargs: dict[str, Any] = {"exc_info": False}
+
+        msg, result = adapter.process("hello", kwargs)
+
+        assert msg == "hello"
+        assert result is kwargs
+        assert result == {"exc_info": False}
+
+    def test_process_moves_custom_kwargs_into_extra(self) -> None:
+        """[TC-LOG-012] 추가 필드 추출 - 비표준 인자를 extra로 옮긴다.
+
+        테스트 목적:
+            process가 표준 인자는 유지하고 나머지 키워드 인자를 extra 딕셔너리로 옮기는지 검증한다.
+
+        테스트 시나리오:
+            Given: exc_info, 기존 extra, slot_idx/drive 키워드 인자를 담은 kwargs가 있고
+            When: ContextLogger.process를 호출하면
+            Then: slot_idx/drive는 extra로 병합되고 exc_info는 그대로 남는다
+
+        Notes:
+            None
+        """
+        adapter = ContextLogger(logging.getLogger("test.context"), {})
+        kwargs: dict[str, Any] = {
+            "exc_info": False,
+            "extra": {"source": "ws"},
+            "slot_idx": 1,
+            "drive": "E",
+        }
+
+        _, result = adapter.process("hello", kwargs)
+
+        assert result == {
+            "exc_info": False,
+            "extra": {"source": "ws", "slot_idx": 1, "drive": "E"},
+        }
+
+    def test_process_keeps_call_site_order(self) -> None:
+        """[TC-LOG-021] 필드 순서 - 추가 필드가 호출부에 쓴 순서대로 extra에 담긴다.
+
+        테스트 목적:
+            추가 필드 순서가 해시 시드에 따라 바뀌지 않고 호출부 순서를 유지하는지 검증한다.
+
+        테스트 시나리오:
+            Given: 표준 인자 사이사이에 여러 추가 필드를 섞은 kwargs가 있고
+            When: ContextLogger.process를 호출하면
+            Then: extra의 키 순서가 호출부에 쓴 순서와 같다
+
+        Notes:
+            집합 연산으로 키를 고르면 PYTHONHASHSEED마다 순서가 달라진다.
+        """
+        adapter = ContextLogger(logging.getLogger("test.context"), {})
+        names = ["zeta", "slot_idx", "alpha", "drive", "mid", "beta", "phase", "omega"]
+        kwargs: dict[str, Any] = {"exc_info": False}
+        for i, name in enumerate(names):
+            kwargs[name] = i
+            if i == 3:
+                kwargs["stack_info"] = False
+
+        _, result = adapter.process("hello", kwargs)
+
+        assert list(result["extra"]) == names
+
+
+class TestStructlogLoggerAdapter:
+    """StructlogLoggerAdapter 테스트"""
+
+    def test_adapter_reports_caller_location(self, caplog: pytest.LogCaptureFixture) -> None:
+        """[TC-LOG-013] ILogger 어댑터 - 호출한 함수 위치가 레코드에 기록된다.
+
+        테스트 목적:
+            어댑터가 ILogger 프로토콜을 만족하고, 전달 프레임 없이 호출 위치를 레코드에 남기는지 확인한다.
+
+        테스트 시나리오:
+            Given: ContextLogger를 감싼 StructlogLoggerAdapter가 있고
+            When: 테스트 함수에서 info를 slot_idx 인자와 함께 호출하면
+            Then: ILogger 인스턴스이며 레코드의 funcName이 테스트 함수이고 slot_idx가 추가 속성으로 남는다
+
+        Notes:
+            None
+        """
+        adapter = StructlogLoggerAdapter(ContextLogger(logging.getLogger("test.adapter"), {}))
+
+        with caplog.at_level(logging.INFO, logger="test.adapter"):
+            adapter.info("connected", slot_idx=2)
+
+        assert isinstance(adapter, ILogger)
+        (record,) = caplog.records
+        assert record.funcName == "test_adapter_reports_caller_location"
+        assert record.slot_idx == 2
+
+
+class TestGetLogger:
+    """get_logger/get_ilogger 테스트"""
+
+    def test_loggers_are_cached_per_name(self) -> None:
+        """[TC-LOG-014] 로거 캐시 - 같은 이름에는 같은 어댑터를 반환한다.
+
+        테스트 목적:
+            get_logger/get_ilogger가 이름별로 어댑터를 재사용하고 다른 이름에는 별도 인스턴스를 주는지 확인한다.
+
+        테스트 시나리오:
+            Given: 로거 이름 'test.cache.a'와 'test.cache.b'가 있고
+            When: 각 함수를 같은 이름으로 두 번, 다른 이름으로 한 번 호출하면
+            Then: 같은 이름은 동일 객체이고 다른 이름은 다른 객체이다
+
+        Notes:
+            None
+        """
+        assert get_logger("test.cache.a") is get_logger("test.cache.a")
+        assert get_logger("test.cache.a") is not get_logger("test.cache.b")
+        assert get_ilogger("test.cache.a") is get_ilogger("test.cache.a")
+        assert get_logger("test.cache.a").logger is logging.getLogger("test.cache.a")
+
+
+class TestSetupLogging:
+    """setup_logging 테스트"""
+
+    @pytest.fixture
+    def log_settings(self, monkeypatch: pytest.MonkeyPatch) -> Generator[SimpleNamespace, None, None]:
+        """Patch log settings and restore root logger state afterwards."""
+        settings = SimpleNamespace(level="INFO", format="text")
+        monkeypatch.setattr(logging_module, "get_log_settings", lambda: settings)
+        monkeypatch.setattr(logging_module, "_logging_signature", None)
+        monkeypatch.setattr(logging_module, "_console_handler", None)
+        root = logging.getLogger()
+        saved_handlers, saved_level = root.handlers[:], root.level
+
+        yield settings
+
+        root.handlers[:] = saved_handlers
+        root.setLevel(saved_level)
+
+    def test_repeated_setup_is_noop(self, log_settings: SimpleNamespace) -> None:
+        """[TC-LOG-016] 재초기화 생략 - 설정이 같으면 핸들러를 다시 만들지 않는다.
+
+        테스트 목적:
+            동일한 level/format으로 setup_logging을 반복 호출하면 기존 핸들러를 유지하고, 설정이 바뀌면 재구성하는지 확인한다.
+
+        테스트 시나리오:
+            Given: INFO/text 로그 설정이 있고
+            When: setup_logging을 두 번 호출한 뒤 format을 json으로 바꿔 다시 호출하면
+            Then: 처음 두 번은 같은 핸들러 하나가 설치되고 세 번째는 JSONFormatter 핸들러로 교체된다
+
+        Notes:
+            None
+        """
+        setup_logging()
+        first = logging.getLogger().handlers[:]
+        setup_logging()
+        second = logging.getLogger().handlers[:]
+        log_settings.format = "json"
+        setup_logging()
+        third = logging.getLogger().handlers
+
+        assert len(first) == 1
+        assert second == first
+        assert len(third) == 1
+        assert third[0] is not first[0]
+        assert isinstance(third[0].formatter, JSONFormatter)
+
+    @pytest.mark.usefixtures("log_settings")
+    def test_setup_reinstalls_removed_handler(self) -> None:
+        """[TC-LOG-017] 핸들러 복구 - 외부에서 핸들러가 제거되면 다시 설치한다.
+
+        테스트 목적:
+            설정이 같더라도 root 로거에서 핸들러가 사라졌다면 setup_logging이 재구성하는지 검증한다.
+
+        테스트 시나리오:
+            Given: setup_logging으로 핸들러가 설치된 상태에서
+            When: root 로거 핸들러를 비우고 setup_logging을 다시 호출하면
+            Then: 새 콘솔 핸들러 하나가 설치된다
+
+        Notes:
+            None
+        """
+        setup_logging()
+        logging.getLogger().handlers.clear()
+
+        setup_logging()
+
+        assert len(logging.getLogger().handlers) == 1
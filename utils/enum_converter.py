@@ -10,7 +10,7 @@ Note:
 """
 
 from enum import Enum
-from typing import TypeVar
+from typing import Any, TypeVar
 
 from domain.enums import (
     TestCapacity,
@@ -21,6 +21,17 @@ from domain.enums import (
 
 E = TypeVar("E", bound=Enum)
 
+# Enum 클래스별 값 → 멤버 조회 테이블 (최초 사용 시 생성)
+_MEMBERS_BY_VALUE: dict[type[Enum], dict[Any, Enum]] = {}
+
+
+def _members_by_value(enum_class: type[E]) -> dict[Any, E]:
+    """Return the value-to-member table for ``enum_class``, building it once."""
+    members = _MEMBERS_BY_VALUE.get(enum_class)
+    if members is None:
+        members = _MEMBERS_BY_VALUE[enum_class] = {m.value: m for m in enum_class}
+    return members  # type: ignore[return-value]
+
 
 def to_enum(value: str, enum_class: type[E], default: E) -> E:
     """문자열을 Enum으로 변환. 실패 시 기본값 반환.
@@ -39,9 +50,10 @@ def to_enum(value: str, enum_class: type[E], default: E) -> E:
         >>> to_enum("invalid", TestCapacity, TestCapacity.GB_32)
         <TestCapacity.GB_32: '32GB'>
     """
+    # 실패 시 ValueError 예외 경로 대신 dict 조회로 기본값 반환
     try:
-        return enum_class(value)
-    except ValueError:
+        return _members_by_value(enum_class).get(value, default)
+    except TypeError:  # 해시 불가능한 값 (예: JSON 리스트)
         return default
 
 
@@ -2,26 +2,109 @@
 
 Structured logging configuration matching Backend's logger format.
 Uses standard logging module for consistency with AIO_EVT_Parser backend.
+
+Suppressed records skip ContextLogger.process, but the call's arguments are
+still evaluated. In polling loops, guard DEBUG calls whose keyword values are
+costly to build:
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Polling MFC state", slot_idx=slot_idx, ...)
 """
 
 import json
 import logging
 import sys
+import time
 from contextvars import ContextVar
-from datetime import datetime
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional
 
 from config.settings import get_log_settings
 
-# Context variable for agent context tracking
-agent_context_var: ContextVar[Dict[str, Any]] = ContextVar("agent_context", default={})
+try:
+    import orjson
+except ImportError:  # orjson은 선택 의존성 (없으면 표준 json 사용)
+    orjson = None
+
+
+def _orjson_dumps(data: Dict[str, Any]) -> str:
+    """Serialize a log payload with orjson (stdlib json for what it rejects)."""
+    try:
+        # 슬롯 인덱스 딕셔너리({0: "idle"})처럼 문자열이 아닌 키도 표준 json과 동일하게 처리
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    except TypeError:
+        # 64비트를 넘는 정수 등 orjson이 지원하지 않는 값은 표준 json으로 직렬화
+        return _stdlib_dumps(data)
+
+
+def _stdlib_dumps(data: Dict[str, Any]) -> str:
+    """Serialize a log payload with stdlib json (same layout as orjson)."""
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+_json_dumps = _orjson_dumps if orjson is not None else _stdlib_dumps
+
+# Standard LogRecord attributes (not treated as extra fields)
+_STANDARD_ATTRS = frozenset(
+    {
+        "name",
+        "msg",
+        "args",
+        "created",
+        "filename",
+        "funcName",
+        "levelname",
+        "levelno",
+        "lineno",
+        "module",
+        "msecs",
+        "message",
+        "pathname",
+        "process",
+        "processName",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "exc_info",
+        "exc_text",
+        "stack_info",
+        "extra_fields",
+        "taskName",
+    }
+)
+
+# Keyword arguments understood by Logger._log (everything else becomes extra)
+_STANDARD_KWARGS = frozenset({"exc_info", "stack_info", "stacklevel", "extra"})
+
+# Shared read-only extra_fields for records with nothing to merge
+_EMPTY_FIELDS: Mapping[str, Any] = MappingProxyType({})
+
+# Context variable for agent context tracking.
+# Holds (context dict, pre-rendered JSON members of that dict without braces);
+# the fragment is rebuilt only when the context changes, and is left empty
+# when the context is not JSON-serializable (formatters then merge the dict).
+agent_context_var: ContextVar[tuple[Dict[str, Any], str]] = ContextVar(
+    "agent_context", default=({}, "")
+)
+
+
+def _set_context(context: Dict[str, Any]) -> None:
+    """Store a new context dict together with its pre-rendered JSON fragment."""
+    try:
+        fragment = _json_dumps(context)[1:-1] if context else ""
+    except TypeError:
+        # JSON 미지원 값(Path 등)은 바인딩 시점에 실패시키지 않고 포맷 시 병합 경로로 처리
+        fragment = ""
+    agent_context_var.set((context, fragment))
 
 
 class ContextFilter(logging.Filter):
     """Filter to inject extra fields into log records.
 
     This filter merges extra keyword arguments from logger calls
-    into the record so that formatters can access them.
+    into the record so that formatters can access them. Bound agent
+    context is added by the formatters, not stored on the record.
     """
 
     def filter(self, record: logging.LogRecord) -> bool:
@@ -33,46 +116,23 @@ class ContextFilter(logging.Filter):
         Returns:
             Always True to allow the record to be processed.
         """
-        # Initialize extra_fields if not present
-        if not hasattr(record, "extra_fields"):
-            record.extra_fields = {}
-
-        # Merge agent context (bound context like agent_name, agent_version)
-        context = agent_context_var.get()
-        if context:
-            record.extra_fields.update(context)
-
-        # Merge any custom attributes added via extra={...}
+        # Collect custom attributes added via extra={...}
         # Exclude standard LogRecord attributes
-        standard_attrs = {
-            "name",
-            "msg",
-            "args",
-            "created",
-            "filename",
-            "funcName",
-            "levelname",
-            "levelno",
-            "lineno",
-            "module",
-            "msecs",
-            "message",
-            "pathname",
-            "process",
-            "processName",
-            "relativeCreated",
-            "thread",
-            "threadName",
-            "exc_info",
-            "exc_text",
-            "stack_info",
-            "extra_fields",
-            "taskName",
+        extras = {
+            key: value
+            for key, value in record.__dict__.items()
+            if key not in _STANDARD_ATTRS and key[:1] != "_"
         }
 
-        for key, value in record.__dict__.items():
-            if key not in standard_attrs and not key.startswith("_"):
-                record.extra_fields[key] = value
+        fields = getattr(record, "extra_fields", None)
+        if fields is None or fields is _EMPTY_FIELDS:
+            # 병합할 내용이 없으면 공유 빈 매핑을 사용 (레코드마다 dict 할당 생략)
+            if not extras:
+                record.extra_fields = _EMPTY_FIELDS
+                return True
+            fields = record.extra_fields = {}
+
+        fields.update(extras)
 
         return True
 
@@ -82,8 +142,33 @@ class JSONFormatter(logging.Formatter):
 
     Outputs log records as JSON objects matching Backend format:
     {"timestamp", "level", "logger", "message", "module", "function", "line", ...extra}
+
+    Extra attributes are read directly from the record in a single pass,
+    so ContextFilter is not required in front of this formatter.
     """
 
+    def __init__(self) -> None:
+        """Initialize JSON formatter."""
+        super().__init__()
+        # 같은 초에 찍힌 레코드는 초 단위 UTC 문자열을 재사용
+        self._ts_cached_sec = -1
+        self._ts_cached_str = ""
+
+    def _format_timestamp(self, record: logging.LogRecord) -> str:
+        """Format record creation time as ISO 8601 UTC with milliseconds.
+
+        Args:
+            record: Log record to format.
+
+        Returns:
+            Timestamp string such as '2025-01-01T12:00:00.123Z'.
+        """
+        sec = int(record.created)
+        if sec != self._ts_cached_sec:
+            self._ts_cached_str = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+            self._ts_cached_sec = sec
+        return f"{self._ts_cached_str}.{int(record.msecs):03d}Z"
+
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON.
 
@@ -94,7 +179,7 @@ class JSONFormatter(logging.Formatter):
             JSON-formatted log string.
         """
         log_data: Dict[str, Any] = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": self._format_timestamp(record),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -107,11 +192,25 @@ class JSONFormatter(logging.Formatter):
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
 
-        # Add extra fields (including agent context)
-        if hasattr(record, "extra_fields"):
-            log_data.update(record.extra_fields)
+        # Add extra fields straight from the record (no ContextFilter needed)
+        record_dict = record.__dict__
+        for key, value in record_dict.items():
+            if key not in _STANDARD_ATTRS and key[:1] != "_":
+                log_data[key] = value
+
+        # Add agent context (bound context like agent_name, agent_version)
+        context, fragment = agent_context_var.get()
+        if not context:
+            return _json_dumps(log_data)
+        if fragment and context.keys().isdisjoint(log_data):
+            # 키 충돌이 없으면 미리 직렬화한 컨텍스트를 닫는 괄호 앞에 이어 붙임
+            return f"{_json_dumps(log_data)[:-1]},{fragment}}}"
 
-        return json.dumps(log_data)
+        # 충돌 시 컨텍스트는 기본 필드보다 우선, 추가 필드보다는 후순위
+        for key, value in context.items():
+            if key not in record_dict or key in _STANDARD_ATTRS or key[:1] == "_":
+                log_data[key] = value
+        return _json_dumps(log_data)
 
 
 class TextFormatter(logging.Formatter):
@@ -138,9 +237,14 @@ class TextFormatter(logging.Formatter):
         """
         base_msg = super().format(record)
 
-        # Append extra fields if present
-        if hasattr(record, "extra_fields") and record.extra_fields:
-            extras = " ".join(f"{k}={v}" for k, v in record.extra_fields.items())
+        # Append agent context and extra fields if present
+        fields = getattr(record, "extra_fields", _EMPTY_FIELDS)
+        context = agent_context_var.get()[0]
+        if context:
+            fields = {**context, **fields}
+        if fields:
+            # join은 어차피 리스트로 변환하므로 제너레이터 대신 리스트를 전달
+            extras = " ".join([f"{k}={v}" for k, v in fields.items()])
             return f"{base_msg} | {extras}"
 
         return base_msg
@@ -163,25 +267,43 @@ class ContextLogger(logging.LoggerAdapter):
         Returns:
             Tuple of (message, modified kwargs).
         """
+        # 대부분의 호출은 추가 필드가 없으므로 그대로 통과
+        if kwargs.keys() <= _STANDARD_KWARGS:
+            return msg, kwargs
+
         # Extract extra fields from kwargs (non-standard logging kwargs)
         extra = kwargs.get("extra", {})
-        standard_kwargs = {"exc_info", "stack_info", "stacklevel", "extra"}
-
-        for key in list(kwargs.keys()):
-            if key not in standard_kwargs:
-                extra[key] = kwargs.pop(key)
+        # 호출부 순서를 유지해야 출력 필드 순서가 PYTHONHASHSEED와 무관해진다
+        for key in [k for k in kwargs if k not in _STANDARD_KWARGS]:
+            extra[key] = kwargs.pop(key)
 
         kwargs["extra"] = extra
         return msg, kwargs
 
 
+
+# setup_logging이 마지막으로 적용한 (level, format)과 설치한 핸들러
+_logging_signature: Optional[tuple[str, str]] = None
+_console_handler: Optional[logging.Handler] = None
+
+
 def setup_logging() -> None:
     """Initialize logging system.
 
     Configures logging in JSON or console format based on environment settings.
     Matches Backend's logger configuration for consistent log format.
+    Calling it again with unchanged settings is a no-op while its handler is
+    still installed on the root logger.
     """
+    global _logging_signature, _console_handler
+
     settings = get_log_settings()
+    signature = (settings.level.upper(), settings.format.lower())
+    if (
+        signature == _logging_signature
+        and _console_handler in logging.getLogger().handlers
+    ):
+        return
 
     # Validate log level
     numeric_level = getattr(logging, settings.level.upper(), logging.INFO)
@@ -199,24 +321,30 @@ def setup_logging() -> None:
     # Remove existing handlers
     root_logger.handlers.clear()
 
-    # Add context filter to capture extra fields
-    context_filter = ContextFilter()
-
     # Console handler (stdout)
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(numeric_level)
     console_handler.setFormatter(formatter)
-    console_handler.addFilter(context_filter)
+    if isinstance(formatter, TextFormatter):
+        # JSONFormatter reads extras from the record itself
+        console_handler.addFilter(ContextFilter())
     root_logger.addHandler(console_handler)
 
+    _logging_signature = signature
+    _console_handler = console_handler
+
     # Silence noisy third-party loggers
     logging.getLogger("websockets").setLevel(logging.WARNING)
     logging.getLogger("asyncio").setLevel(logging.WARNING)
 
 
+@lru_cache(maxsize=256)
 def get_logger(name: Optional[str] = None) -> ContextLogger:
     """Return Logger instance.
 
+    Adapters are cached per name, so repeated calls return the same shared
+    instance; its ``extra`` mapping is read-only.
+
     Args:
         name: Logger name. If None, uses caller's module name.
 
@@ -224,7 +352,7 @@ def get_logger(name: Optional[str] = None) -> ContextLogger:
         ContextLogger instance that supports keyword arguments.
     """
     logger = logging.getLogger(name)
-    return ContextLogger(logger, {})
+    return ContextLogger(logger, _EMPTY_FIELDS)
 
 
 def bind_context(**kwargs: Any) -> None:
@@ -233,11 +361,13 @@ def bind_context(**kwargs: Any) -> None:
     Bound values will be included in all subsequent logs.
 
     Args:
-        **kwargs: Key-value pairs to bind.
+        **kwargs: Key-value pairs to bind. JSON-serializable contexts are
+            pre-rendered once here rather than per log record; other
+            values are merged into each JSON record at format time.
     """
-    current = agent_context_var.get().copy()
+    current = agent_context_var.get()[0].copy()
     current.update(kwargs)
-    agent_context_var.set(current)
+    _set_context(current)
 
 
 def unbind_context(*keys: str) -> None:
@@ -246,23 +376,30 @@ def unbind_context(*keys: str) -> None:
     Args:
         *keys: List of keys to remove.
     """
-    current = agent_context_var.get().copy()
+    current = agent_context_var.get()[0].copy()
     for key in keys:
         current.pop(key, None)
-    agent_context_var.set(current)
+    _set_context(current)
 
 
 def clear_context() -> None:
     """Clear global logging context."""
-    agent_context_var.set({})
+    agent_context_var.set(({}, ""))
 
 
 class StructlogLoggerAdapter:
     """Logger adapter implementing ILogger protocol.
 
-    Wraps ContextLogger to conform to ILogger interface.
+    Wraps ContextLogger to conform to ILogger interface. The log methods
+    are the wrapped logger's bound methods, so calls skip a forwarding
+    frame and records report the real caller's function and line.
     """
 
+    debug: Callable[..., None]
+    info: Callable[..., None]
+    warning: Callable[..., None]
+    error: Callable[..., None]
+
     def __init__(self, logger: ContextLogger) -> None:
         """Initialize adapter.
 
@@ -270,27 +407,18 @@ class StructlogLoggerAdapter:
             logger: ContextLogger instance.
         """
         self._logger = logger
-
-    def debug(self, message: str, **kwargs: Any) -> None:
-        """Debug log."""
-        self._logger.debug(message, **kwargs)
-
-    def info(self, message: str, **kwargs: Any) -> None:
-        """Info log."""
-        self._logger.info(message, **kwargs)
-
-    def warning(self, message: str, **kwargs: Any) -> None:
-        """Warning log."""
-        self._logger.warning(message, **kwargs)
-
-    def error(self, message: str, **kwargs: Any) -> None:
-        """Error log."""
-        self._logger.error(message, **kwargs)
+        self.debug = logger.debug
+        self.info = logger.info
+        self.warning = logger.warning
+        self.error = logger.error
 
 
+@lru_cache(maxsize=256)
 def get_ilogger(name: Optional[str] = None) -> StructlogLoggerAdapter:
     """Return ILogger-compatible logger instance.
 
+    Cached per name like get_logger.
+
     Args:
         name: Logger name. If None, uses caller's module name.
 